@@ -28,14 +28,16 @@ with a meaningful message if the request fails or returns malformed JSON.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta
 import logging
 from typing import List, Dict, Optional, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from dateutil import parser as dateparser
+from app.core import http_cache, jsonio
+from app.core.odds_api import build_retry_session, commence_window, fmt_iso
 from app.core.errors import OddsApiQuotaError
 
 # In production you would likely pull an API key from the environment and use
@@ -57,15 +59,22 @@ DEFAULT_PARAMS = {
 BM_KEYS = ("hardrockbet", "hardrock")
 
 def _to_int(x: Optional[int]) -> Optional[int]:
-    try:
-        return int(x) if x is not None else None
-    except Exception:
-        return None
+    return int(x) if x is not None else None
 
 
+@lru_cache(maxsize=512)
 def _to_utc(dt_str: str) -> datetime:
-    """Parse a datetime string and return an aware UTC ``datetime``."""
+    """Parse a datetime string and return an aware UTC ``datetime``.
+
+    The Odds API sends ``YYYY-MM-DDTHH:MM:SSZ``, which ``fromisoformat``
+    handles directly; anything else goes through dateutil.
+    """
 
+    if dt_str.endswith("Z"):
+        try:
+            return datetime.fromisoformat(dt_str[:-1]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
     dt = dateparser.isoparse(dt_str)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
@@ -95,7 +104,7 @@ def _check_quota_or_raise(resp: requests.Response) -> None:
     if resp.status_code == 401:
         body_text = ""
         try:
-            data = resp.json()
+            data = jsonio.loads(resp.content)
             if isinstance(data, dict):
                 body_text = " ".join(str(v) for v in data.values() if v is not None)
             else:
@@ -113,22 +122,129 @@ def _check_quota_or_raise(resp: requests.Response) -> None:
         pass
 
 
-def _build_retry_session() -> requests.Session:
-    session = requests.Session()
-    retries = Retry(
-        total=3,
-        connect=3,
-        read=3,
-        status=3,
-        backoff_factor=0.5,
-        status_forcelist=(500, 502, 503, 504),
-        allowed_methods=frozenset({"GET"}),
-        raise_on_status=False,
-    )
-    adapter = HTTPAdapter(max_retries=retries)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
+def _request(
+    params: Dict[str, str],
+    timeout: Tuple[float, float],
+    headers: Dict[str, str],
+) -> requests.Response:
+    """Issue one Odds API request, mapping failures to project errors."""
+
+    try:
+        resp = build_retry_session().get(
+            API_URL,
+            params=params,
+            timeout=timeout,
+            headers=headers,
+        )
+        _check_quota_or_raise(resp)
+        resp.raise_for_status()
+        return resp
+    except requests.Timeout as exc:
+        raise RuntimeError("Timeout fetching Hard Rock odds") from exc
+    except requests.HTTPError as exc:  # pragma: no cover - branch tested
+        status = exc.response.status_code if exc.response else "unknown"
+        # Surface quota errors distinctly
+        if isinstance(status, int) and status in (402, 429):
+            raise OddsApiQuotaError(f"The Odds API quota/rate limit hit (HTTP {status})") from exc
+        raise RuntimeError(f"HTTP {status} fetching Hard Rock odds") from exc
+    except requests.RequestException as exc:  # pragma: no cover - branch tested
+        # Try to detect quota error from body text
+        msg = str(exc)
+        if any(k in msg.lower() for k in ("no_active_plan", "insufficient", "quota", "rate limit")):
+            raise OddsApiQuotaError("The Odds API quota/rate limit hit") from exc
+        raise RuntimeError(f"Error fetching Hard Rock odds: {exc}") from exc
+
+
+def _parse_body(body: bytes) -> List[Dict]:
+    try:
+        return jsonio.loads(body)
+    except ValueError as exc:
+        raise RuntimeError("Invalid JSON from Hard Rock odds endpoint") from exc
+
+
+def _parse_event(
+    event: Dict,
+    now: datetime,
+    cutoff: datetime,
+    now_iso: str,
+    cutoff_iso: str,
+) -> Optional[Dict]:
+    """Convert one Odds API event into a game dict, or ``None`` if out of window.
+
+    Malformed values raise ``TypeError``/``ValueError`` so the caller can skip
+    the event with a single handler instead of guarding every field.
+    """
+
+    commence = event.get("commence_time")
+    if not commence:
+        return None
+    # Canonical ``YYYY-MM-DDTHH:MM:SSZ`` strings sort chronologically, so most
+    # out-of-window events are dropped without parsing. The ISO bounds are
+    # truncated to whole seconds, which keeps this pre-check conservative;
+    # the datetime comparisons below still decide the boundary cases.
+    if len(commence) == 20 and commence[-1] == "Z":
+        if commence < now_iso or commence > cutoff_iso:
+            return None
+    start_dt = _to_utc(commence)
+    if start_dt < now:
+        return None  # ignore games that have already started
+    # Ignore games outside the cutoff window (focus on current week) before
+    # reading anything else from the event
+    if start_dt > cutoff:
+        return None
+
+    game_id = event.get("id")
+    home_team = event.get("home_team")
+    # Prefer explicit away_team if provided by API, otherwise infer from "teams"
+    away_team = event.get("away_team")
+    if not away_team:
+        teams = event.get("teams", [])
+        away_team = next((t for t in teams if t != home_team), None)
+
+    odds_home = odds_away = None
+    line_home = line_away = None
+    ml_home = ml_away = None
+    bookmakers = event.get("bookmakers", [])
+    if bookmakers:
+        bm_by_key = {b.get("key"): b for b in bookmakers}
+        bm = next((bm_by_key[k] for k in BM_KEYS if bm_by_key.get(k)), bookmakers[0])
+        markets_by_key = {m.get("key"): m for m in bm.get("markets", [])}
+        market_spread = markets_by_key.get("spreads")
+        if market_spread:
+            for o in market_spread.get("outcomes", ()):
+                name = o.get("name")
+                if name is None:
+                    continue
+                if name == home_team:
+                    odds_home = _to_int(o.get("price"))
+                    line_home = o.get("point")
+                elif name == away_team:
+                    odds_away = _to_int(o.get("price"))
+                    line_away = o.get("point")
+        market_ml = markets_by_key.get("h2h")
+        if market_ml:
+            for o in market_ml.get("outcomes", ()):
+                name = o.get("name")
+                if name is None:
+                    continue
+                if name == home_team:
+                    ml_home = _to_int(o.get("price"))
+                elif name == away_team:
+                    ml_away = _to_int(o.get("price"))
+
+    return {
+        "game_id": game_id,
+        "home": home_team,
+        "away": away_team,
+        "start_utc": fmt_iso(start_dt),
+        "market": "BOTH",
+        "odds_home": odds_home,
+        "odds_away": odds_away,
+        "line_home": line_home,
+        "line_away": line_away,
+        "ml_home": ml_home,
+        "ml_away": ml_away,
+    }
 
 
 def fetch_hr_nfl_moneylines(
@@ -155,107 +271,33 @@ def fetch_hr_nfl_moneylines(
 
     params = DEFAULT_PARAMS.copy()
     params["daysFrom"] = str(days_from)
+    params.update(commence_window(days_from))
 
     api_key = os.getenv("THEODDSAPI")
     if api_key:
         params["apiKey"] = api_key
 
-    try:
-        with _build_retry_session() as session:
-            resp = session.get(API_URL, params=params, timeout=timeout)
-        _check_quota_or_raise(resp)
-        resp.raise_for_status()
-    except requests.Timeout as exc:
-        raise RuntimeError("Timeout fetching Hard Rock odds") from exc
-    except requests.HTTPError as exc:  # pragma: no cover - branch tested
-        status = exc.response.status_code if exc.response else "unknown"
-        # Surface quota errors distinctly
-        if isinstance(status, int) and status in (402, 429):
-            raise OddsApiQuotaError(f"The Odds API quota/rate limit hit (HTTP {status})") from exc
-        raise RuntimeError(f"HTTP {status} fetching Hard Rock odds") from exc
-    except requests.RequestException as exc:  # pragma: no cover - branch tested
-        # Try to detect quota error from body text
-        msg = str(exc)
-        if any(k in msg.lower() for k in ("no_active_plan", "insufficient", "quota", "rate limit")):
-            raise OddsApiQuotaError("The Odds API quota/rate limit hit") from exc
-        raise RuntimeError(f"Error fetching Hard Rock odds: {exc}") from exc
-
-    try:
-        events = resp.json()
-    except ValueError as exc:
-        raise RuntimeError("Invalid JSON from Hard Rock odds endpoint") from exc
+    cache_key = http_cache.cache_key(API_URL, params)
+    events = http_cache.fetch(
+        cache_key,
+        lambda headers: _request(params, timeout, headers),
+        _parse_body,
+    )
 
     now = datetime.now(timezone.utc)
     cutoff = now + timedelta(days=max(1, int(days_from)))
+    now_iso = fmt_iso(now)
+    cutoff_iso = fmt_iso(cutoff)
     games: List[Dict] = []
 
     for event in events:
-        commence = event.get("commence_time")
-        if not commence:
-            continue
-        start_dt = _to_utc(commence)
-        if start_dt < now:
-            continue  # ignore games that have already started
-
-        game_id = event.get("id")
-        home_team = event.get("home_team")
-        # Prefer explicit away_team if provided by API, otherwise infer from "teams"
-        away_team = event.get("away_team")
-        if not away_team:
-            teams = event.get("teams", [])
-            away_team = next((t for t in teams if t != home_team), None)
-
-        # Ignore games outside the cutoff window (focus on current week)
-        if start_dt > cutoff:
+        try:
+            game = _parse_event(event, now, cutoff, now_iso, cutoff_iso)
+        except (TypeError, ValueError, OverflowError):
+            logging.getLogger(__name__).warning("Skipping malformed Hard Rock event %r", event.get("id"))
             continue
+        if game is not None:
+            games.append(game)
 
-        odds_home = odds_away = None
-        line_home = line_away = None
-        ml_home = ml_away = None
-        bookmakers = event.get("bookmakers", [])
-        if bookmakers:
-            bm = None
-            for key in BM_KEYS:
-                bm = next((b for b in bookmakers if b.get("key") == key), None)
-                if bm:
-                    break
-            if bm is None:
-                bm = bookmakers[0]
-            markets = bm.get("markets", [])
-            market_spread = next((m for m in markets if m.get("key") == "spreads"), None)
-            if market_spread:
-                outcomes = {o.get("name"): o for o in market_spread.get("outcomes", [])}
-                if home_team is not None and home_team in outcomes:
-                    oh = outcomes[home_team]
-                    odds_home = _to_int(oh.get("price"))
-                    line_home = oh.get("point")
-                if away_team is not None and away_team in outcomes:
-                    oa = outcomes[away_team]
-                    odds_away = _to_int(oa.get("price"))
-                    line_away = oa.get("point")
-            market_ml = next((m for m in markets if m.get("key") == "h2h"), None)
-            if market_ml:
-                outcomes = {o.get("name"): o for o in market_ml.get("outcomes", [])}
-                if home_team is not None and home_team in outcomes:
-                    ml_home = _to_int(outcomes[home_team].get("price"))
-                if away_team is not None and away_team in outcomes:
-                    ml_away = _to_int(outcomes[away_team].get("price"))
-
-        games.append(
-            {
-                "game_id": game_id,
-                "home": home_team,
-                "away": away_team,
-                "start_utc": start_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "market": "BOTH",
-                "odds_home": odds_home,
-                "odds_away": odds_away,
-                "line_home": line_home,
-                "line_away": line_away,
-                "ml_home": ml_home,
-                "ml_away": ml_away,
-            }
-        )
-
-    games.sort(key=lambda g: g["start_utc"])  # deterministic ordering for cron jobs
+    games.sort(key=itemgetter("start_utc"))  # deterministic ordering for cron jobs
     return games
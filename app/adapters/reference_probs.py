@@ -12,11 +12,12 @@ request failures raise ``RuntimeError`` so the caller can notify and stop.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from app.core import http_cache, jsonio
+from app.core.odds_api import build_retry_session, commence_window
 from app.core.errors import OddsApiQuotaError
 import logging
 
@@ -28,54 +29,67 @@ def build_pinnacle_fair_ladder(event: dict) -> Dict[float, float] | None:
     Returns a mapping from favorite spreads (negative numbers) to the fair
     probability that the favorite covers that spread.
     """
-    bm = None
-    for b in event.get("bookmakers", []):
-        if b.get("key") == BOOKMAKER:
-            bm = b
-            break
+    bm = _find_bookmaker(event)
     if not bm:
         return None
+    try:
+        return _fair_ladder(bm.get("markets", []))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _find_bookmaker(event: dict) -> dict | None:
+    for b in event.get("bookmakers", []):
+        if b.get("key") == BOOKMAKER:
+            return b
+    return None
+
+
+def _fair_ladder(markets: List[dict]) -> Dict[float, float] | None:
     ladder: Dict[float, float] = {}
-    for m in bm.get("markets", []):
+    for m in markets:
         if m.get("key") != "spreads":
             continue
-        outs = m.get("outcomes", [])
-        # Extract points and prices
-        fav_point: Optional[float] = None
-        fav_price: Optional[int] = None
-        dog_price: Optional[int] = None
-        for o in outs:
-            name = o.get("name")
-            point = o.get("point")
-            price = _to_int(o.get("price"))
-            if point is None or price is None:
-                continue
-            try:
-                p = float(point)
-            except Exception:
-                continue
-            # Favorite has negative point at that market
-            if p < 0:
-                fav_point = p
-                fav_price = price
-            else:
-                dog_price = price
-        if fav_point is None or fav_price is None or dog_price is None:
-            continue
-        q_fav = american_to_implied_prob(fav_price)
-        q_dog = american_to_implied_prob(dog_price)
-        s = q_fav + q_dog
-        if s <= 0:
-            continue
-        p_fav = q_fav / s
-        ladder[fav_point] = p_fav
+        entry = _fav_entry(m.get("outcomes", []))
+        if entry is not None:
+            ladder[entry[0]] = entry[1]
     return ladder or None
 
-def _to_int(x: Optional[int]) -> Optional[int]:
-    try:
-        return int(x) if x is not None else None
-    except Exception:
+
+def _fav_entry(outs: List[dict]) -> Tuple[float, float] | None:
+    """Favorite point and fair cover probability for one spreads market.
+
+    Sides are told apart by the sign of ``point`` alone (the favorite lays
+    points), so outcome names do not need to match the event's teams.
+    """
+    fav_point: Optional[float] = None
+    fav_price: Optional[int] = None
+    dog_price: Optional[int] = None
+    for o in outs:
+        point = o.get("point")
+        price = _to_int(o.get("price"))
+        if point is None or price is None:
+            continue
+        p = float(point)
+        if p < 0:
+            fav_point = p
+            fav_price = price
+        else:
+            dog_price = price
+    if fav_point is None or fav_price is None or dog_price is None:
         return None
+    p_fav, _ = _devig_prices(fav_price, dog_price)
+    return fav_point, p_fav
+
+
+# Plain casts: malformed values raise and are handled once per event by the
+# callers (``_from_external`` / ``build_pinnacle_fair_ladder``).
+def _to_int(x: Optional[int]) -> Optional[int]:
+    return int(x) if x is not None else None
+
+
+def _to_float(x: Optional[float]) -> Optional[float]:
+    return float(x) if x is not None else None
 
 
 ODDS_API_URL = (
@@ -85,22 +99,25 @@ BOOKMAKER = "pinnacle"
 PINNACLE_TIMEOUT: Tuple[float, float] = (3.0, 12.0)
 
 
-def _build_retry_session() -> requests.Session:
-    session = requests.Session()
-    retries = Retry(
-        total=3,
-        connect=3,
-        read=3,
-        status=3,
-        backoff_factor=0.5,
-        status_forcelist=(500, 502, 503, 504),
-        allowed_methods=frozenset({"GET"}),
-        raise_on_status=False,
+def _request(params: Dict[str, str], headers: Dict[str, str]) -> requests.Response:
+    resp = build_retry_session().get(
+        ODDS_API_URL,
+        params=params,
+        timeout=PINNACLE_TIMEOUT,
+        headers=headers,
     )
-    adapter = HTTPAdapter(max_retries=retries)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
+    # Quota/rate limit detection
+    if resp.status_code in (402, 429):
+        raise OddsApiQuotaError(f"The Odds API quota/rate limit hit (HTTP {resp.status_code})")
+    # Warn if about to exhaust
+    remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("X-Requests-Remaining")
+    try:
+        if remaining is not None and str(remaining).isdigit() and int(remaining) <= 0:
+            logging.getLogger(__name__).warning("The Odds API requests remaining is 0; further calls may fail")
+    except Exception:
+        pass
+    resp.raise_for_status()
+    return resp
 
 
 def _devig(p1: float, p2: float) -> tuple[float, float]:
@@ -108,6 +125,17 @@ def _devig(p1: float, p2: float) -> tuple[float, float]:
     return (p1 / s, p2 / s) if s > 0 else (0.5, 0.5)
 
 
+@lru_cache(maxsize=4096)
+def _devig_prices(price_1: int, price_2: int) -> tuple[float, float]:
+    """Fair (vig-free) probabilities for a two-way market's American prices.
+
+    Alt-line ladders repeat the same handful of price pairs, so results are
+    memoized on the (integer) prices.
+    """
+
+    return _devig(american_to_implied_prob(price_1), american_to_implied_prob(price_2))
+
+
 def _from_external(game_id: str, event: dict) -> dict | None:
     """Extract vig-free probabilities and spread ladders for a single event.
 
@@ -116,14 +144,10 @@ def _from_external(game_id: str, event: dict) -> dict | None:
     """
 
     try:
-        bm = None
-        for b in event.get("bookmakers", []):
-            if b.get("key") == BOOKMAKER:
-                bm = b
-                break
+        bm = _find_bookmaker(event)
         if not bm:
             return None
-        fav_ladder = build_pinnacle_fair_ladder(event) or {}
+        fav_ladder: Dict[float, float] = {}
         ladder_home: Dict[float, float] = {}
         ladder_away: Dict[float, float] = {}
         prices_home: Dict[float, int] = {}
@@ -132,52 +156,50 @@ def _from_external(game_id: str, event: dict) -> dict | None:
         ml_away_prob: Optional[float] = None
         ml_price_home: Optional[int] = None
         ml_price_away: Optional[int] = None
+        side_of = {event.get("home_team"): "home", event.get("away_team"): "away"}
         # Some APIs provide multiple "spreads" entries for alternate lines
         for m in bm.get("markets", []):
             key = m.get("key")
             outs = m.get("outcomes", [])
             if key == "spreads":
+                # Same classification as build_pinnacle_fair_ladder, so the
+                # favorite ladder does not depend on outcome names matching
+                entry = _fav_entry(outs)
+                if entry is not None:
+                    fav_ladder[entry[0]] = entry[1]
                 price_home: Optional[int] = None
                 price_away: Optional[int] = None
                 line_home: Optional[float] = None
                 line_away: Optional[float] = None
                 for o in outs:
-                    if o.get("name") == event.get("home_team"):
+                    side = side_of.get(o.get("name"))
+                    if side == "home":
                         price_home = _to_int(o.get("price"))
                         line_home = o.get("point")
-                    elif o.get("name") == event.get("away_team"):
+                    elif side == "away":
                         price_away = _to_int(o.get("price"))
                         line_away = o.get("point")
                 if price_home is None or price_away is None:
                     continue
-                p_h = american_to_implied_prob(price_home)
-                p_a = american_to_implied_prob(price_away)
-                p_h, p_a = _devig(p_h, p_a)
-                if line_home is not None:
-                    try:
-                        ladder_home[float(line_home)] = p_h
-                        if price_home is not None:
-                            prices_home[float(line_home)] = int(price_home)
-                    except Exception:
-                        pass
-                if line_away is not None:
-                    try:
-                        ladder_away[float(line_away)] = p_a
-                        if price_away is not None:
-                            prices_away[float(line_away)] = int(price_away)
-                    except Exception:
-                        pass
+                p_h, p_a = _devig_prices(price_home, price_away)
+                lh = _to_float(line_home)
+                la = _to_float(line_away)
+                if lh is not None:
+                    ladder_home[lh] = p_h
+                    prices_home[lh] = price_home
+                if la is not None:
+                    ladder_away[la] = p_a
+                    prices_away[la] = price_away
             elif key == "h2h":
                 price_home = price_away = None
                 for o in outs:
-                    if o.get("name") == event.get("home_team"):
+                    side = side_of.get(o.get("name"))
+                    if side == "home":
                         price_home = _to_int(o.get("price"))
-                    elif o.get("name") == event.get("away_team"):
+                    elif side == "away":
                         price_away = _to_int(o.get("price"))
                 if price_home is not None and price_away is not None:
-                    p_h = american_to_implied_prob(price_home)
-                    p_a = american_to_implied_prob(price_away)
-                    p_h, p_a = _devig(p_h, p_a)
+                    p_h, p_a = _devig_prices(price_home, price_away)
                     ml_home_prob = p_h
                     ml_away_prob = p_a
                     ml_price_home = price_home
@@ -189,10 +211,8 @@ def _from_external(game_id: str, event: dict) -> dict | None:
             "fav_ladder": fav_ladder,
         }
         if ladder_home and ladder_away:
-            def _closest_line(d: Dict[float, float]) -> float:
-                return sorted(d.keys(), key=lambda x: abs(x))[0]
-            ch = _closest_line(ladder_home)
-            ca = _closest_line(ladder_away)
+            ch = min(ladder_home, key=abs)
+            ca = min(ladder_away, key=abs)
             result.update({
                 "p_home": ladder_home[ch],
                 "p_away": ladder_away[ca],
@@ -212,18 +232,20 @@ def _from_external(game_id: str, event: dict) -> dict | None:
         return None
 
 
-def reference_probs_for(games: List[Dict]) -> Dict[str, Dict[str, float]]:
-    """Return vig-removed reference probabilities for each game.
+def fetch_pinnacle_board(days_from: Optional[int] = None) -> List[dict]:
+    """Fetch every upcoming NFL event with Pinnacle spreads and moneylines.
 
-    Parameters
-    ----------
-    games:
-        Iterable of game dictionaries containing at minimum ``game_id``.
-    """
+    ``days_from`` limits the board to events kicking off within that many
+    days (matching the Hard Rock window); ``None`` returns every event.
 
-    out: Dict[str, Dict[str, float]] = {}
+    The request does not depend on the Hard Rock games, so callers may issue
+    it concurrently with :func:`app.adapters.hardrock_odds.fetch_hr_nfl_moneylines`
+    and join the two locally via :func:`reference_probs_for`.
+
+    Raises ``OddsApiQuotaError`` on quota/rate limiting and ``RuntimeError``
+    on any other failure.
+    """
 
-    data = None
     params = {
         "markets": "spreads,h2h",
         "regions": "us",
@@ -232,25 +254,19 @@ def reference_probs_for(games: List[Dict]) -> Dict[str, Dict[str, float]]:
         "dateFormat": "iso",
         # The Odds API may include alternate lines under the same key; no extra flag here.
     }
+    if days_from is not None:
+        params.update(commence_window(days_from))
     api_key = os.getenv("THEODDSAPI")
     if api_key:
         params["apiKey"] = api_key
     # Require external reference prices; raise on failure so caller can abort
+    cache_key = http_cache.cache_key(ODDS_API_URL, params)
     try:
-        with _build_retry_session() as session:
-            resp = session.get(ODDS_API_URL, params=params, timeout=PINNACLE_TIMEOUT)
-        # Quota/rate limit detection
-        if resp.status_code in (402, 429):
-            raise OddsApiQuotaError(f"The Odds API quota/rate limit hit (HTTP {resp.status_code})")
-        # Warn if about to exhaust
-        remaining = resp.headers.get("x-requests-remaining") or resp.headers.get("X-Requests-Remaining")
-        try:
-            if remaining is not None and str(remaining).isdigit() and int(remaining) <= 0:
-                logging.getLogger(__name__).warning("The Odds API requests remaining is 0; further calls may fail")
-        except Exception:
-            pass
-        resp.raise_for_status()
-        data = resp.json()
+        data = http_cache.fetch(
+            cache_key,
+            lambda headers: _request(params, headers),
+            jsonio.loads,
+        )
     except OddsApiQuotaError:
         raise
     except Exception as exc:
@@ -259,8 +275,29 @@ def reference_probs_for(games: List[Dict]) -> Dict[str, Dict[str, float]]:
         if any(k in msg.lower() for k in ("no_active_plan", "insufficient", "quota", "rate limit")):
             raise OddsApiQuotaError("The Odds API quota/rate limit hit") from exc
         raise RuntimeError(f"Failed to fetch Pinnacle reference probabilities: {exc}") from exc
+    return data or []
+
+
+def reference_probs_for(
+    games: List[Dict],
+    events: Optional[List[dict]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Return vig-removed reference probabilities for each game.
+
+    Parameters
+    ----------
+    games:
+        Iterable of game dictionaries containing at minimum ``game_id``.
+    events:
+        Pinnacle events previously returned by :func:`fetch_pinnacle_board`.
+        Fetched on demand when omitted.
+    """
+
+    out: Dict[str, Dict[str, float]] = {}
 
-    index = {e.get("id"): e for e in data or []}
+    if events is None:
+        events = fetch_pinnacle_board()
+    index = {e.get("id"): e for e in events}
 
     for g in games:
         rid = g["game_id"]
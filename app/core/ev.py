@@ -1,12 +1,12 @@
 def american_to_implied_prob(odds: int) -> float:
-    return 100 / (odds + 100) if odds > 0 else abs(odds) / (abs(odds) + 100)
+    return 100 / (odds + 100) if odds > 0 else -odds / (100 - odds)
 
 def payout_multiple(odds: int) -> float:
     """Return net payout multiple b per $1 stake for American odds.
 
     Example: +120 -> 1.2, -150 -> 100/150 ~= 0.6667
     """
-    return (odds / 100) if odds > 0 else (100 / abs(odds))
+    return (odds / 100) if odds > 0 else (-100 / odds)
 
 def break_even_prob(odds: int, p_push: float = 0.0) -> float:
     """Break-even win probability accounting for push probability.
@@ -36,3 +36,15 @@ def kelly_fraction(p_win: float, odds: int, p_push: float = 0.0) -> float:
     p_push = max(0.0, min(1.0, p_push))
     q = 1.0 - p_win - p_push
     return (b * p_win - q) / b
+
+def ev_and_kelly(p_win: float, odds: int, p_push: float = 0.0) -> tuple[float, float]:
+    """Return ``(expected_value_per_dollar, kelly_fraction)`` in one pass.
+
+    Shares the payout multiple and clamped probabilities between the two.
+    """
+    b = payout_multiple(odds)
+    p_win = max(0.0, min(1.0, p_win))
+    p_push = max(0.0, min(1.0, p_push))
+    q = 1.0 - p_win - p_push
+    ev = p_win * b - q
+    return ev, ev / b
@@ -0,0 +1,133 @@
+"""Short-lived in-process cache for Odds API response bodies.
+
+Odds barely move within a minute, so back-to-back polls can reuse the last
+body instead of paying for another request. Within ``ODDS_CACHE_TTL`` seconds
+the cached body is served without touching the network; afterwards the
+request is revalidated with ``If-None-Match``/``If-Modified-Since`` when the
+server supplied validators. A TTL of ``0`` (the default) disables caching.
+
+Entries are keyed on the URL and the static query parameters. The API key
+and the moving kickoff window are left out, so each endpoint holds at most
+one entry (replaced on every fetch) and revalidation keeps working when the
+window moves on.
+
+Bodies are only cached once the caller has parsed them, so a malformed
+response is not replayed for the whole TTL.
+"""
+
+from __future__ import annotations
+
+import os
+from time import monotonic
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+import requests
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+_ENTRIES: Dict[Tuple, _Entry] = {}
+
+T = TypeVar("T")
+
+
+def cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.getenv("ODDS_CACHE_TTL", "0")))
+    except ValueError:
+        return 0.0
+
+
+_UNKEYED_PARAMS = frozenset({"apiKey", "commenceTimeFrom", "commenceTimeTo"})
+
+
+def cache_key(url: str, params: Dict[str, str]) -> Tuple:
+    return (url, tuple(sorted((k, v) for k, v in params.items() if k not in _UNKEYED_PARAMS)))
+
+
+def fresh_body(key: Tuple) -> bytes | None:
+    """Return the cached body if it is younger than the TTL."""
+
+    ttl = cache_ttl()
+    entry = _ENTRIES.get(key)
+    if ttl <= 0 or entry is None:
+        return None
+    if monotonic() - entry.stored_at < ttl:
+        return entry.body
+    return None
+
+
+def conditional_headers(key: Tuple) -> Dict[str, str]:
+    """Validators for a conditional GET of a stale entry (empty if none)."""
+
+    entry = _ENTRIES.get(key)
+    if cache_ttl() <= 0 or entry is None:
+        return {}
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def store(key: Tuple, resp: requests.Response) -> None:
+    """Remember a successful response whose body has been parsed."""
+
+    if cache_ttl() > 0:
+        _ENTRIES[key] = _Entry(
+            body=resp.content,
+            stored_at=monotonic(),
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+
+def revalidated(key: Tuple) -> bytes | None:
+    """Refresh the TTL of an entry after a ``304 Not Modified``.
+
+    Returns ``None`` when the entry is gone (e.g. cleared while the request
+    was in flight), in which case the caller must refetch unconditionally.
+    """
+
+    entry = _ENTRIES.get(key)
+    if entry is None:
+        return None
+    entry.stored_at = monotonic()
+    return entry.body
+
+
+def fetch(
+    key: Tuple,
+    get: Callable[[Dict[str, str]], requests.Response],
+    parse: Callable[[bytes], T],
+) -> T:
+    """Return ``parse(body)`` for ``key``, hitting the network only when needed.
+
+    ``get`` issues the request with the given extra headers and raises on
+    failure. The response is cached only after ``parse`` succeeds.
+    """
+
+    body = fresh_body(key)
+    if body is not None:
+        return parse(body)
+    resp = get(conditional_headers(key))
+    if resp.status_code == 304:
+        body = revalidated(key)
+        if body is not None:
+            return parse(body)
+        resp = get({})
+    parsed = parse(resp.content)
+    store(key, resp)
+    return parsed
+
+
+def clear() -> None:
+    _ENTRIES.clear()
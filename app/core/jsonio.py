@@ -0,0 +1,29 @@
+"""JSON encoding/decoding helpers.
+
+Uses ``orjson`` when it is installed and falls back to the stdlib ``json``
+module otherwise. Both raise a ``ValueError`` subclass on malformed input.
+"""
+
+from __future__ import annotations
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+    import json
+
+
+def loads(data: bytes | str):
+    """Decode a JSON document from raw response bytes (or text)."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -1,16 +1,54 @@
+import atexit
 import logging
 import os
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core import jsonio
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _build_session() -> requests.Session:
+    """Return the process-wide webhook session.
+
+    Reused across pushes to keep the Discord TLS connection alive. Only
+    rate-limited (429) responses are retried, honouring ``Retry-After``;
+    a 5xx may already have posted the message, so it is not repeated.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=1, pool_maxsize=2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
+
+
 def push(title: str, lines: list[str]):
     url = os.getenv("DISCORD_WEBHOOK_URL")
     if not url:
         logger.error("DISCORD_WEBHOOK_URL is not set; skipping notification")
         return
     content = f"**{title}**\n" + "\n".join(lines)
-    r = requests.post(url, json={"content": content}, timeout=10)
+    r = _build_session().post(
+        url,
+        data=jsonio.dumps({"content": content}),
+        headers={"Content-Type": "application/json"},
+        timeout=10,
+    )
     r.raise_for_status()
@@ -0,0 +1,60 @@
+"""Helpers shared by the Odds API adapters (Hard Rock and Pinnacle)."""
+
+from __future__ import annotations
+
+import atexit
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@lru_cache(maxsize=1)
+def build_retry_session() -> requests.Session:
+    """Return the process-wide retrying session for The Odds API.
+
+    Built once and shared by both adapters so polls keep the pooled TLS
+    connection alive.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        connect=3,
+        read=3,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+def fmt_iso(dt: datetime) -> str:
+    """Format an aware UTC ``datetime`` as ``YYYY-MM-DDTHH:MM:SSZ``."""
+
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+
+
+def commence_window(days_from: int) -> Dict[str, str]:
+    """Server-side kickoff bounds so the API only returns events we keep.
+
+    Bounds are widened to whole hours (and an hour past the cutoff) so they
+    never cut off a game that the exact window, enforced when parsing, would
+    keep. The bounds are not part of the body cache key. Both adapters use
+    this one definition so their requests cover the same window.
+    """
+
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    end = now + timedelta(days=max(1, int(days_from)), hours=1)
+    return {
+        "commenceTimeFrom": fmt_iso(now),
+        "commenceTimeTo": fmt_iso(end),
+    }
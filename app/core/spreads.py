@@ -1,31 +1,34 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple, Optional
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Optional
 
 
-def p_fav_half(target: float, ladder: Dict[float, float], max_gap: Optional[float] = None) -> Optional[Tuple[float, bool]]:
+def p_fav_half(
+    target: float,
+    ladder: Dict[float, float],
+    max_gap: Optional[float] = None,
+    xs: Optional[List[float]] = None,
+) -> Optional[Tuple[float, bool]]:
     """Return fair probability that the favorite covers target half-spread.
 
     Ladder maps favorite half/whole spreads (negative numbers for fav) to
     de‑vig probabilities of favorite covering at that spread. Linear
-    interpolation is used between nearest neighbors if needed.
+    interpolation is used between nearest neighbors if needed. ``xs`` may
+    carry the ladder's keys already sorted so repeat lookups skip the sort.
     """
     if target in ladder:
         return ladder[target], False
     if not ladder:
         return None
-    xs = sorted(ladder.keys())
-    lo = None
-    hi = None
-    for x in xs:
-        if x <= target:
-            lo = x
-        if x >= target and hi is None:
-            hi = x
-    if lo is None or hi is None:
+    if xs is None:
+        xs = sorted(ladder.keys())
+    # ``target`` is not a key, so its neighbors straddle the insertion point
+    i = bisect_left(xs, target)
+    if i == 0 or i == len(xs):
         return None
-    if lo == hi:
-        return ladder[lo], False
+    lo = xs[i - 1]
+    hi = xs[i]
     # Enforce maximum interpolation gap if provided
     if max_gap is not None:
         if abs(target - lo) > max_gap or abs(hi - target) > max_gap:
@@ -41,21 +44,26 @@ def map_hr_to_probs(
     s_hr: float,
     ladder: Dict[float, float],
     max_gap: Optional[float] = None,
+    xs: Optional[List[float]] = None,
 ) -> Optional[Tuple[float, float, float, Dict[str, bool]]]:
     """Map a Hard Rock contract to (p_win, p_push, p_lose) using a favorite ladder.
 
     side: 'home' or 'away' is not used directly; favorite/dog is inferred from s_hr.
     s_hr: HR spread for the selected side (negative = favorite, positive = dog).
     ladder: favorite ladder mapping fav spreads (negative) to p_fav_cover.
+    xs: optional presorted ladder keys, shared when mapping several lines
+        against the same ladder.
     """
     # Determine favorite/dog by line sign for this side
     if s_hr is None:
         return None
     # Half point: push ~ 0
     meta = {"whole": False, "interpolated": False}
+    if xs is None:
+        xs = sorted(ladder)
     if abs(s_hr - round(s_hr)) > 1e-6:  # non-integer -> treat as half-point
         if s_hr < 0:  # favorite at -x.5
-            res = p_fav_half(s_hr, ladder, max_gap)
+            res = p_fav_half(s_hr, ladder, max_gap, xs)
             if res is None:
                 return None
             p_win, interp = res
@@ -64,7 +72,7 @@ def map_hr_to_probs(
             p_lose = 1.0 - p_win
             return p_win, p_push, p_lose, meta
         else:  # underdog at +x.5
-            res = p_fav_half(-abs(s_hr), ladder, max_gap)
+            res = p_fav_half(-abs(s_hr), ladder, max_gap, xs)
             if res is None:
                 return None
             p_fav, interp = res
@@ -78,8 +86,8 @@ def map_hr_to_probs(
     n = abs(int(round(s_hr)))
     s_lo = -(n - 0.5)
     s_hi = -(n + 0.5)
-    r_lo = p_fav_half(s_lo, ladder, max_gap)
-    r_hi = p_fav_half(s_hi, ladder, max_gap)
+    r_lo = p_fav_half(s_lo, ladder, max_gap, xs)
+    r_hi = p_fav_half(s_hi, ladder, max_gap, xs)
     if r_lo is None or r_hi is None:
         return None
     p_lo, interp_lo = r_lo
@@ -1,4 +1,4 @@
-import sqlite3, time
+import atexit, sqlite3, time
 DB_PATH = "/data/bets.sqlite"
 DDL = """
 CREATE TABLE IF NOT EXISTS signals(
@@ -9,24 +9,54 @@ CREATE TABLE IF NOT EXISTS signals(
 CREATE UNIQUE INDEX IF NOT EXISTS signals_unique
   ON signals(game_id, market, pick, odds);
 """
+_CONNS: dict[str, sqlite3.Connection] = {}
 def db():
-    c = sqlite3.connect(DB_PATH); c.executescript(DDL); return c
+    """Return the connection for ``DB_PATH``, opening it (and running DDL) once."""
+    c = _CONNS.get(DB_PATH)
+    if c is None:
+        c = sqlite3.connect(DB_PATH, uri=True)
+        # Append-only ledger: WAL with NORMAL sync avoids an fsync per commit
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.executescript(DDL)
+        _CONNS[DB_PATH] = c
+    return c
+def close() -> None:
+    while _CONNS:
+        _CONNS.popitem()[1].close()
+atexit.register(close)
+_INSERT = """INSERT OR IGNORE INTO signals(ts,game_id,market,pick,odds,p_true,edge,kelly,stake,status)
+                     VALUES (?,?,?,?,?,?,?,?,?,?)"""
+def _row(sig: dict, ts: int) -> tuple:
+    return (
+        ts,
+        sig["game_id"],
+        sig["market"],
+        sig["pick"],
+        sig["odds"],
+        sig["p_true"],
+        sig["edge"],
+        sig["kelly"],
+        sig["stake"],
+        "NEW",
+    )
 def save_signal(sig:dict) -> bool:
+    return save_signals([sig])[0]
+def save_signals(sigs: list[dict], limit: int | None = None) -> list[bool]:
+    """Insert signals in order within one transaction.
+
+    Returns one flag per attempted signal (``False`` for duplicates). With
+    ``limit``, stops once that many new rows have been inserted so signals
+    that will not be notified are not recorded either.
+    """
+    ts = int(time.time())
+    inserted: list[bool] = []
+    new = 0
     with db() as c:
-        cur = c.execute(
-            """INSERT OR IGNORE INTO signals(ts,game_id,market,pick,odds,p_true,edge,kelly,stake,status)
-                     VALUES (?,?,?,?,?,?,?,?,?,?)""",
-            (
-                int(time.time()),
-                sig["game_id"],
-                sig["market"],
-                sig["pick"],
-                sig["odds"],
-                sig["p_true"],
-                sig["edge"],
-                sig["kelly"],
-                sig["stake"],
-                "NEW",
-            ),
-        )
-        return bool(cur.rowcount)
+        for sig in sigs:
+            if limit is not None and new >= limit:
+                break
+            ok = bool(c.execute(_INSERT, _row(sig, ts)).rowcount)
+            inserted.append(ok)
+            new += ok
+    return inserted
@@ -1,12 +1,15 @@
-import os, time, schedule, logging, requests
+import hashlib, os, time, schedule, logging, requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from app.adapters.hardrock_odds import fetch_hr_nfl_moneylines
-from app.adapters.reference_probs import reference_probs_for
+from app.adapters.reference_probs import fetch_pinnacle_board, reference_probs_for
+from app.core import jsonio
 from app.core.errors import OddsApiQuotaError
-from app.core.ev import expected_value_per_dollar, kelly_fraction, break_even_prob
+from app.core.ev import expected_value_per_dollar, ev_and_kelly, break_even_prob
 from app.core.spreads import map_hr_to_probs as map_probs
-from app.core.store import save_signal
+from app.core.store import save_signals
 from app.core.notify import push
 
 logging.basicConfig(
@@ -14,8 +17,10 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s %(name)s: %(message)s",
 )
 logger = logging.getLogger(__name__)
-_LAST_SIG: str | None = None
+_LAST_SIG: bytes | None = None
 _SKIP_NEXT: bool = False
+_LAST_HR_EMPTY: bool = False
+_LAST_QUOTA_HIT: bool = False
 _QUOTA_NOTIFIED_FOR: tuple[int, int] | None = None
 
 BANKROLL        = float(os.getenv("BANKROLL","500"))
@@ -39,31 +44,72 @@ TITLE      = "NFL +EV Signals on Hard Rock Bet"
 
 BASE_SPREAD_EDGE = max(MIN_EDGE, 0.03)
 BASE_ML_EDGE = max(MIN_EDGE_ML, 0.03)
+# Stricter spread floors where the fair probability is less certain
+WHOLE_SPREAD_EDGE = max(BASE_SPREAD_EDGE, 0.035)
+NEAR_KEY_SPREAD_EDGE = max(WHOLE_SPREAD_EDGE, 0.04)
 
 # When to run scheduled jobs
 SUNDAY_RUN_TIME  = os.getenv("SUNDAY_RUN_TIME", "12:00")
 WEEKDAY_RUN_TIME = os.getenv("WEEKDAY_RUN_TIME", "09:00")
 
-def clamp(x, lo, hi): return max(lo, min(hi, x))
+# Team abbreviations for cleaner logs/notifications
+TEAM_ABBR = {
+    "Arizona Cardinals":"ARI","Atlanta Falcons":"ATL","Baltimore Ravens":"BAL","Buffalo Bills":"BUF",
+    "Carolina Panthers":"CAR","Chicago Bears":"CHI","Cincinnati Bengals":"CIN","Cleveland Browns":"CLE",
+    "Dallas Cowboys":"DAL","Denver Broncos":"DEN","Detroit Lions":"DET","Green Bay Packers":"GB",
+    "Houston Texans":"HOU","Indianapolis Colts":"IND","Jacksonville Jaguars":"JAX","Kansas City Chiefs":"KC",
+    "Las Vegas Raiders":"LV","Los Angeles Chargers":"LAC","Los Angeles Rams":"LAR","Miami Dolphins":"MIA",
+    "Minnesota Vikings":"MIN","New England Patriots":"NE","New Orleans Saints":"NO","New York Giants":"NYG",
+    "New York Jets":"NYJ","Philadelphia Eagles":"PHI","Pittsburgh Steelers":"PIT","San Francisco 49ers":"SF",
+    "Seattle Seahawks":"SEA","Tampa Bay Buccaneers":"TB","Tennessee Titans":"TEN","Washington Commanders":"WAS",
+}
+def abbr(name:str)->str: return TEAM_ABBR.get(name, name)
+
+
+def nearest_price(pr_map: Dict[float, int], target: float):
+    """Return ``(price, line)`` for the ladder line closest to ``target``."""
+    if not pr_map:
+        return None, None
+    key = min(pr_map.keys(), key=lambda x: abs(x-target))
+    return pr_map.get(key), key
+
+
+def _fmt_kickoff_local(iso_utc: str) -> str:
+    try:
+        ts = iso_utc.replace("Z","+00:00")
+        dt = datetime.fromisoformat(ts)
+        local = dt.astimezone()
+        return local.strftime("%a %H:%M")
+    except Exception:
+        return iso_utc
+
+
+# Discord alert block: minimal, readable, with emojis. American odds always
+# carry a sign (+120 / -110).
+_ALERT_FMT = (
+    "\n{away} @ {home} — {kickoff} 👊 {edge_pct:+.1f}% EV"
+    "\n* Pick: {pick} at {odds:+d}"
+    "\n* Stake: ${stake:.2f}"
+)
 
 
 def _spread_edge_threshold(meta: Dict[str, bool] | None, line: float | int | None) -> float:
     """Return the minimum EV required for a spread opportunity."""
 
-    thr = BASE_SPREAD_EDGE
     if line is None:
-        return thr
+        return BASE_SPREAD_EDGE
     try:
         abs_line = abs(float(line))
     except (TypeError, ValueError):
-        return thr
+        return BASE_SPREAD_EDGE
     meta = meta or {}
-    near_key = min(abs(abs_line - 3.0), abs(abs_line - 7.0)) <= 0.5
-    if meta.get("whole") or meta.get("interpolated"):
-        thr = max(thr, 0.035)
-    if meta.get("interpolated") and near_key:
-        thr = max(thr, 0.04)
-    return thr
+    if meta.get("interpolated"):
+        if min(abs(abs_line - 3.0), abs(abs_line - 7.0)) <= 0.5:
+            return NEAR_KEY_SPREAD_EDGE
+        return WHOLE_SPREAD_EDGE
+    if meta.get("whole"):
+        return WHOLE_SPREAD_EDGE
+    return BASE_SPREAD_EDGE
 
 
 def _passes_threshold(alert: Dict[str, object]) -> bool:
@@ -81,7 +127,7 @@ def _passes_threshold(alert: Dict[str, object]) -> bool:
             threshold = BASE_SPREAD_EDGE
     return edge >= threshold - 1e-9
 
-def _hr_signature(games: list[dict]) -> str:
+def _hr_signature(games: list[dict]) -> bytes:
     try:
         items = []
         for g in games:
@@ -92,9 +138,9 @@ def _hr_signature(games: list[dict]) -> str:
                 g.get("ml_home"), g.get("ml_away"),
             ))
         items.sort()
-        return str(items)
+        return hashlib.blake2b(jsonio.dumps(items), digest_size=16).digest()
     except Exception:
-        return ""
+        return b""
 
 def _current_month_key(now: datetime | None = None) -> tuple[int, int]:
     now = now or datetime.now(timezone.utc)
@@ -147,19 +193,40 @@ def _extract_ref_prob_reason(exc: Exception) -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
+def _board_pool() -> ThreadPoolExecutor:
+    """Single worker that runs the Pinnacle board fetch alongside Hard Rock."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="pinnacle-board")
+
+
 def run_once():
     _reset_quota_notice()
+    global _LAST_HR_EMPTY, _LAST_QUOTA_HIT
+    # Both Odds API requests are independent; overlap them so the poll costs
+    # max(t_hr, t_ref) instead of the sum. While Hard Rock keeps returning an
+    # empty board (e.g. between slates) or the last run hit the quota, check
+    # Hard Rock first and only spend a Pinnacle request once it succeeds.
+    board_future = None
+    if not (_LAST_HR_EMPTY or _LAST_QUOTA_HIT):
+        board_future = _board_pool().submit(fetch_pinnacle_board, days_from=MAX_DAYS_AHEAD)
     try:
         games = fetch_hr_nfl_moneylines(days_from=MAX_DAYS_AHEAD)
     except OddsApiQuotaError as qe:
+        _LAST_QUOTA_HIT = True
+        if board_future is not None:
+            board_future.cancel()
         logger.error("Odds API quota/rate limit encountered fetching Hard Rock: %s", qe)
         _notify_quota_once()
         return
     except Exception:
+        if board_future is not None:
+            board_future.cancel()
         logger.exception("Failed to fetch Hard Rock NFL odds")
         push(TITLE + " - Error", ["Failed to fetch Hard Rock NFL odds; aborting."])
         return
+    _LAST_QUOTA_HIT = False
     logger.info("Fetched %d upcoming games from Hard Rock (spreads & MLs)", len(games))
+    _LAST_HR_EMPTY = not games
     if not games:
         logger.info("No upcoming Hard Rock NFL games found; skipping notifications.")
         return
@@ -171,8 +238,13 @@ def run_once():
         _SKIP_NEXT = True
     _LAST_SIG = sig
     try:
-        ref   = reference_probs_for(games)
+        if board_future is not None:
+            board = board_future.result()
+        else:
+            board = fetch_pinnacle_board(days_from=MAX_DAYS_AHEAD)
+        ref   = reference_probs_for(games, board)
     except OddsApiQuotaError as qe:
+        _LAST_QUOTA_HIT = True
         logger.error("Odds API quota/rate limit encountered fetching Pinnacle refs: %s", qe)
         _notify_quota_once()
         return
@@ -190,146 +262,113 @@ def run_once():
     if not games:
         logger.info("No upcoming games matched Pinnacle references; skipping notifications.")
         return
-    def _interp_prob(side_map: Dict[float, float], target: float) -> float | None:
-        if target in side_map:
-            return side_map[target]
-        if not side_map:
-            return None
-        xs = sorted(side_map.keys())
-        # find neighbors
-        lo = None
-        hi = None
-        for x in xs:
-            if x <= target:
-                lo = x
-            if x >= target and hi is None:
-                hi = x
-        if lo is None or hi is None:
-            return None
-        if lo == hi:
-            return side_map[lo]
-        p_lo = side_map[lo]
-        p_hi = side_map[hi]
-        t = (target - lo) / (hi - lo)
-        return p_lo + t * (p_hi - p_lo)
-
-    def _push_prob(side_map: Dict[float, float], line: float) -> float:
-        # Pushes occur on whole numbers only; approximate mass between +/- 0.5
-        if line is None:
-            return 0.0
-        if abs(line - round(line)) > 1e-6:
-            return 0.0
-        p_m = _interp_prob(side_map, line - 0.5)
-        p_p = _interp_prob(side_map, line + 0.5)
-        if p_m is None or p_p is None:
-            return 0.0
-        return max(0.0, abs(p_m - p_p))
-
-    # Team abbreviations for cleaner logs/notifications
-    TEAM_ABBR = {
-        "Arizona Cardinals":"ARI","Atlanta Falcons":"ATL","Baltimore Ravens":"BAL","Buffalo Bills":"BUF",
-        "Carolina Panthers":"CAR","Chicago Bears":"CHI","Cincinnati Bengals":"CIN","Cleveland Browns":"CLE",
-        "Dallas Cowboys":"DAL","Denver Broncos":"DEN","Detroit Lions":"DET","Green Bay Packers":"GB",
-        "Houston Texans":"HOU","Indianapolis Colts":"IND","Jacksonville Jaguars":"JAX","Kansas City Chiefs":"KC",
-        "Las Vegas Raiders":"LV","Los Angeles Chargers":"LAC","Los Angeles Rams":"LAR","Miami Dolphins":"MIA",
-        "Minnesota Vikings":"MIN","New England Patriots":"NE","New Orleans Saints":"NO","New York Giants":"NYG",
-        "New York Jets":"NYJ","Philadelphia Eagles":"PHI","Pittsburgh Steelers":"PIT","San Francisco 49ers":"SF",
-        "Seattle Seahawks":"SEA","Tampa Bay Buccaneers":"TB","Tennessee Titans":"TEN","Washington Commanders":"WAS",
-    }
-    def abbr(name:str)->str: return TEAM_ABBR.get(name, name)
+    # The log, alert and test-force passes map the same (game, side) lines;
+    # compute each mapping once per run and sort each game's ladder once.
+    mapped: Dict[tuple, object] = {}
+    ladder_keys: Dict[str, List[float]] = {}
+    def _map(rid: str, side: str, line: float, fav_ladder: Dict[float, float]):
+        key = (rid, side, line)
+        if key not in mapped:
+            xs = ladder_keys.get(rid)
+            if xs is None:
+                xs = ladder_keys[rid] = sorted(fav_ladder)
+            mapped[key] = map_probs(side, float(line), fav_ladder, MAX_INTERP_GAP, xs)
+        return mapped[key]
 
     # Log concise matched games; only include EV when calculable via ladder
-    for g in games:
-        rid = g["game_id"]
-        pr = ref.get(rid, {})
-        oh = g.get("odds_home")
-        oa = g.get("odds_away")
-        lh = g.get("line_home")
-        la = g.get("line_away")
-        ladder = (pr or {}).get("ladder", {})
-        ladder_h = ladder.get("home", {})
-        ladder_a = ladder.get("away", {})
-        fav_ladder = (pr or {}).get("fav_ladder", {})
-        prices = (pr or {}).get("prices", {})
-        prices_h = prices.get("home", {})
-        prices_a = prices.get("away", {})
-        ml_ref = (pr or {}).get("ml", {})
-        ml_ref_prices = ml_ref.get("prices", {})
-        ml_ph = ml_ref.get("home")
-        ml_pa = ml_ref.get("away")
-
-        ev_h = ev_a = None
-        ev_mlh = ev_mla = None
-        skip_parts = []
-        if oh is not None and lh is not None and fav_ladder:
-            mp = map_probs("home", float(lh), fav_ladder, MAX_INTERP_GAP)
-            if mp is not None:
-                p_win, p_push, _, _meta = mp
-                ev_h = expected_value_per_dollar(p_win, oh, p_push)
-            else:
-                skip_parts.append(f"H {float(lh):+0.1f}")
-        if oa is not None and la is not None and fav_ladder:
-            mp = map_probs("away", float(la), fav_ladder, MAX_INTERP_GAP)
-            if mp is not None:
-                p_win, p_push, _, _meta = mp
-                ev_a = expected_value_per_dollar(p_win, oa, p_push)
-            else:
-                skip_parts.append(f"A {float(la):+0.1f}")
-
-        mlh = g.get("ml_home")
-        mla = g.get("ml_away")
-        if mlh is not None and ml_ph is not None:
-            ev_mlh = expected_value_per_dollar(ml_ph, mlh, 0.0)
-        if mla is not None and ml_pa is not None:
-            ev_mla = expected_value_per_dollar(ml_pa, mla, 0.0)
-
-        # Choose nearest Pinnacle display prices to HR lines for log context
-        def nearest_price(pr_map:Dict[float,int], target:float):
-            if not pr_map:
-                return None, None
-            key = min(pr_map.keys(), key=lambda x: abs(x-target))
-            return pr_map.get(key), key
-
-        ph, ph_line = (nearest_price(prices_h, float(lh)) if lh is not None else (None, None))
-        pa, pa_line = (nearest_price(prices_a, float(la)) if la is not None else (None, None))
-        mph = ml_ref_prices.get("home") if ml_ref_prices else None
-        mpa = ml_ref_prices.get("away") if ml_ref_prices else None
-
-        # Log even if EV not available, but keep concise
-        logger.info(
-            "%s @ %s - %s | HR: H %s(%s) A %s(%s) | P: H %s(%s) A %s(%s)%s",
-            abbr(g.get("away","")), abbr(g.get("home","")), g.get("start_utc"),
-            oh, (f"{lh:+.1f}" if lh is not None else "-"),
-            oa, (f"{la:+.1f}" if la is not None else "-"),
-            (ph if ph is not None else "-"), (f"{ph_line:+.1f}" if ph_line is not None else "-"),
-            (pa if pa is not None else "-"), (f"{pa_line:+.1f}" if pa_line is not None else "-"),
-            (" | EV " + " ".join(filter(None,[f"H {ev_h*100:+.1f}%" if ev_h is not None else None, f"A {ev_a*100:+.1f}%" if ev_a is not None else None]))) if (ev_h is not None or ev_a is not None) else "",
-        )
-        if mlh is not None or mla is not None:
+    if logger.isEnabledFor(logging.INFO):
+        for g in games:
+            rid = g["game_id"]
+            pr = ref[rid]
+            oh = g.get("odds_home")
+            oa = g.get("odds_away")
+            lh = g.get("line_home")
+            la = g.get("line_away")
+            ladder = pr.get("ladder", {})
+            ladder_h = ladder.get("home", {})
+            ladder_a = ladder.get("away", {})
+            fav_ladder = pr.get("fav_ladder", {})
+            prices = pr.get("prices", {})
+            prices_h = prices.get("home", {})
+            prices_a = prices.get("away", {})
+            ml_ref = pr.get("ml", {})
+            ml_ref_prices = ml_ref.get("prices", {})
+            ml_ph = ml_ref.get("home")
+            ml_pa = ml_ref.get("away")
+
+            ev_h = ev_a = None
+            ev_mlh = ev_mla = None
+            skip_parts = []
+            if oh is not None and lh is not None and fav_ladder:
+                mp = _map(rid, "home", lh, fav_ladder)
+                if mp is not None:
+                    p_win, p_push, _, _meta = mp
+                    ev_h = expected_value_per_dollar(p_win, oh, p_push)
+                else:
+                    skip_parts.append(f"H {float(lh):+0.1f}")
+            if oa is not None and la is not None and fav_ladder:
+                mp = _map(rid, "away", la, fav_ladder)
+                if mp is not None:
+                    p_win, p_push, _, _meta = mp
+                    ev_a = expected_value_per_dollar(p_win, oa, p_push)
+                else:
+                    skip_parts.append(f"A {float(la):+0.1f}")
+
+            mlh = g.get("ml_home")
+            mla = g.get("ml_away")
+            if mlh is not None and ml_ph is not None:
+                ev_mlh = expected_value_per_dollar(ml_ph, mlh, 0.0)
+            if mla is not None and ml_pa is not None:
+                ev_mla = expected_value_per_dollar(ml_pa, mla, 0.0)
+
+            # Choose nearest Pinnacle display prices to HR lines for log context
+            ph, ph_line = (nearest_price(prices_h, float(lh)) if lh is not None else (None, None))
+            pa, pa_line = (nearest_price(prices_a, float(la)) if la is not None else (None, None))
+            mph = ml_ref_prices.get("home") if ml_ref_prices else None
+            mpa = ml_ref_prices.get("away") if ml_ref_prices else None
+
+            # Log even if EV not available, but keep concise
             logger.info(
-                "%s @ %s - %s | HR ML: H %s A %s | P ML: H %s A %s%s",
+                "%s @ %s - %s | HR: H %s(%s) A %s(%s) | P: H %s(%s) A %s(%s)%s",
                 abbr(g.get("away","")), abbr(g.get("home","")), g.get("start_utc"),
-                mlh if mlh is not None else "-", mla if mla is not None else "-",
-                mph if mph is not None else "-", mpa if mpa is not None else "-",
-                (" | EV " + " ".join(filter(None,[f"H {ev_mlh*100:+.1f}%" if ev_mlh is not None else None, f"A {ev_mla*100:+.1f}%" if ev_mla is not None else None]))) if (ev_mlh is not None or ev_mla is not None) else "",
-            )
-        if skip_parts:
-            logger.debug(
-                "EV unavailable (no nearby Pinnacle alt lines <= %.2f): %s @ %s — %s",
-                MAX_INTERP_GAP,
-                abbr(g.get("away","")),
-                abbr(g.get("home","")),
-                ", ".join(skip_parts),
+                oh, (f"{lh:+.1f}" if lh is not None else "-"),
+                oa, (f"{la:+.1f}" if la is not None else "-"),
+                (ph if ph is not None else "-"), (f"{ph_line:+.1f}" if ph_line is not None else "-"),
+                (pa if pa is not None else "-"), (f"{pa_line:+.1f}" if pa_line is not None else "-"),
+                (" | EV " + " ".join(filter(None,[f"H {ev_h*100:+.1f}%" if ev_h is not None else None, f"A {ev_a*100:+.1f}%" if ev_a is not None else None]))) if (ev_h is not None or ev_a is not None) else "",
             )
+            if mlh is not None or mla is not None:
+                logger.info(
+                    "%s @ %s - %s | HR ML: H %s A %s | P ML: H %s A %s%s",
+                    abbr(g.get("away","")), abbr(g.get("home","")), g.get("start_utc"),
+                    mlh if mlh is not None else "-", mla if mla is not None else "-",
+                    mph if mph is not None else "-", mpa if mpa is not None else "-",
+                    (" | EV " + " ".join(filter(None,[f"H {ev_mlh*100:+.1f}%" if ev_mlh is not None else None, f"A {ev_mla*100:+.1f}%" if ev_mla is not None else None]))) if (ev_mlh is not None or ev_mla is not None) else "",
+                )
+            if skip_parts:
+                logger.debug(
+                    "EV unavailable (no nearby Pinnacle alt lines <= %.2f): %s @ %s — %s",
+                    MAX_INTERP_GAP,
+                    abbr(g.get("away","")),
+                    abbr(g.get("home","")),
+                    ", ".join(skip_parts),
+                )
     if not games:
         logger.warning("No Pinnacle reference odds matched upcoming games")
         push(TITLE + " - Error", ["No Pinnacle odds found for upcoming games; aborting."])
         return
+    # Stake = BANKROLL * min(KELLY_FRAC * k, MAX_UNIT) for k > 0, else 0; fold the constants once per run
+    stake_scale = BANKROLL * KELLY_FRAC
+    stake_cap = BANKROLL * MAX_UNIT
+    def _stake(k: float) -> float:
+        return round(min(stake_cap, stake_scale*k), 2) if k > 0 else 0.0
+    # Each side's EV (and its Kelly fraction, which falls out of the same
+    # arithmetic) is needed to pick the better side; only that side is staked.
     alerts=[]
+    scored=[]  # (game, spread evals, ML evals); reused by test-force mode
     for g in games:
-        rid=g["game_id"]; pr=ref.get(rid)
-        if not pr: continue
-        fav_ladder = (pr or {}).get("fav_ladder", {})
+        rid=g["game_id"]; pr=ref[rid]  # games were filtered to those in ref
+        fav_ladder = pr.get("fav_ladder", {})
         # ----- Spreads -----
         evals=[]
         for side in ("home","away"):
@@ -339,17 +378,16 @@ def run_once():
                 continue
             if not fav_ladder:
                 continue
-            mp = map_probs(side, float(line), fav_ladder, MAX_INTERP_GAP)
+            mp = _map(rid, side, line, fav_ladder)
             if mp is None:
                 continue
             p_win, p_push, _, meta = mp
-            ev=expected_value_per_dollar(p_win, odds, p_push)
-            k=kelly_fraction(p_win, odds, p_push)
-            stake=round(BANKROLL*clamp(KELLY_FRAC*max(0,k),0.0,MAX_UNIT),2)
+            ev, k = ev_and_kelly(p_win, odds, p_push)
             thr = _spread_edge_threshold(meta, line)
-            evals.append((ev,side,odds,p_win,k,stake,line,p_push,thr))
+            evals.append((ev,side,odds,p_win,k,line,p_push,thr))
         if evals:
-            ev,side,odds,p_true,k,stake,line,p_push,thr=max(evals,key=lambda x:x[0])
+            ev,side,odds,p_true,k,line,p_push,thr=max(evals,key=lambda x:x[0])
+            stake=_stake(k)
             if ev>=thr and stake>=1.0:
                 team=g["home"] if side=="home" else g["away"]
                 pick=f"{team} {line:+.1f}"
@@ -361,19 +399,18 @@ def run_once():
                    "event":f"{g['away']} @ {g['home']}","start":g["start_utc"]}
                 alerts.append(a)
         # ----- Moneylines -----
-        ml = (pr or {}).get("ml", {})
+        ml = pr.get("ml", {})
         ml_evals=[]
         for side in ("home","away"):
             odds = g.get(f"ml_{side}")
             p_true = ml.get(side)
             if odds is None or p_true is None:
                 continue
-            ev = expected_value_per_dollar(p_true, odds, 0.0)
-            k = kelly_fraction(p_true, odds, 0.0)
-            stake = round(BANKROLL*clamp(KELLY_FRAC*max(0,k),0.0,MAX_UNIT),2)
-            ml_evals.append((ev, side, odds, p_true, k, stake))
+            ev, k = ev_and_kelly(p_true, odds, 0.0)
+            ml_evals.append((ev, side, odds, p_true, k))
         if ml_evals:
-            ev, side, odds, p_true, k, stake = max(ml_evals, key=lambda x:x[0])
+            ev, side, odds, p_true, k = max(ml_evals, key=lambda x:x[0])
+            stake = _stake(k)
             thr_ml = BASE_ML_EDGE
             if ev >= thr_ml and stake >= 1.0:
                 team = g["home"] if side == "home" else g["away"]
@@ -385,6 +422,7 @@ def run_once():
                    "threshold":thr_ml,
                    "event":f"{g['away']} @ {g['home']}","start":g["start_utc"]}
                 alerts.append(a)
+        scored.append((g, evals, ml_evals))
 
     alerts = [a for a in alerts if _passes_threshold(a)]
 
@@ -392,65 +430,36 @@ def run_once():
     if not alerts and TEST_FORCE_OPPS:
         logger.info("Test mode: forcing %d opportunity/ies for notification", TEST_FORCE_COUNT)
         candidates=[]
-        for g in games:
-            rid = g["game_id"]; pr = ref.get(rid)
-            if not pr:
-                continue
-            fav_ladder = (pr or {}).get("fav_ladder", {})
-            evals=[]
-            for side in ("home","away"):
-                odds = g.get(f"odds_{side}")
-                line = g.get(f"line_{side}")
-                if odds is None or line is None:
-                    continue
-                if not fav_ladder:
-                    continue
-                mp = map_probs(side, float(line), fav_ladder, MAX_INTERP_GAP)
-                if mp is None:
-                    continue
-                p_win, p_push, _, _meta = mp
-                ev = expected_value_per_dollar(p_win, odds, p_push)
-                k = kelly_fraction(p_win, odds, p_push)
-                stake = round(BANKROLL*clamp(KELLY_FRAC*max(0,k),0.0,MAX_UNIT),2)
-                # Ensure we have a visible stake in test mode
-                stake = max(1.0, stake)
-                p_be = break_even_prob(odds, p_push)
+        for g, evals, ml_evals in scored:
+            rid = g["game_id"]
+            for ev,side,odds,p_win,k,line,p_push,_thr in evals:
                 candidates.append({
                     "game_id": rid,
                     "market": "SPREAD",
                     "pick": f"{g['home'] if side=='home' else g['away']} {line:+.1f}",
                     "odds": odds,
                     "p_true": p_win,
-                    "p_be": p_be,
+                    "p_be": break_even_prob(odds, p_push),
                     "p_push": p_push,
                     "edge": ev,
                     "kelly": k,
-                    "stake": stake,
+                    # Ensure we have a visible stake in test mode
+                    "stake": max(1.0, _stake(k)),
                     "event": f"{g['away']} @ {g['home']}",
                     "start": g["start_utc"],
                 })
-            ml = (pr or {}).get("ml", {})
-            for side in ("home","away"):
-                odds = g.get(f"ml_{side}")
-                p_true = ml.get(side)
-                if odds is None or p_true is None:
-                    continue
-                ev = expected_value_per_dollar(p_true, odds, 0.0)
-                k = kelly_fraction(p_true, odds, 0.0)
-                stake = round(BANKROLL*clamp(KELLY_FRAC*max(0,k),0.0,MAX_UNIT),2)
-                stake = max(1.0, stake)
-                p_be = break_even_prob(odds, 0.0)
+            for ev, side, odds, p_true, k in ml_evals:
                 candidates.append({
                     "game_id": rid,
                     "market": "ML",
                     "pick": f"{g['home'] if side=='home' else g['away']} ML",
                     "odds": odds,
                     "p_true": p_true,
-                    "p_be": p_be,
+                    "p_be": break_even_prob(odds, 0.0),
                     "p_push": 0.0,
                     "edge": ev,
                     "kelly": k,
-                    "stake": stake,
+                    "stake": max(1.0, _stake(k)),
                     "event": f"{g['away']} @ {g['home']}",
                     "start": g["start_utc"],
                 })
@@ -471,23 +480,14 @@ def run_once():
         return
     alerts.sort(key=lambda a:a["edge"], reverse=True)
     lines=[]
-    def _fmt_kickoff_local(iso_utc: str) -> str:
-        try:
-            ts = iso_utc.replace("Z","+00:00")
-            dt = datetime.fromisoformat(ts)
-            local = dt.astimezone()
-            return local.strftime("%a %H:%M")
-        except Exception:
-            return iso_utc
-
-    sent = 0
     MAX_NOTIFICATIONS = 5
-    for a in alerts:
-        if sent >= MAX_NOTIFICATIONS:
-            break
-        inserted = True
-        if not forced:
-            inserted = save_signal(a)
+    # Record the alerts in one transaction, stopping once enough new ones
+    # are in; duplicates of earlier notifications do not use up a slot.
+    if forced:
+        saved = [True] * min(len(alerts), MAX_NOTIFICATIONS)
+    else:
+        saved = save_signals(alerts, limit=MAX_NOTIFICATIONS)
+    for a, inserted in zip(alerts, saved):
         if not inserted:
             logger.info(
                 "Skipping duplicate alert for %s (%s at %s) — already notified",
@@ -496,14 +496,11 @@ def run_once():
                 a.get("odds"),
             )
             continue
-        # Discord: minimal, readable, with emojis
         away, home = a['event'].split(' @ ')
-        title_line = f"{abbr(away)} @ {abbr(home)} — {_fmt_kickoff_local(a['start'])} 👊 {a['edge']*100:+.1f}% EV"
-        # Ensure American odds include a '+' sign for positive values
-        pick_line = f"* Pick: {a['pick']} at {a['odds']:+d}"
-        stake_line = f"* Stake: ${a['stake']:.2f}"
-        lines.append(f"\n{title_line}\n{pick_line}\n{stake_line}")
-        sent += 1
+        lines.append(_ALERT_FMT.format(
+            away=abbr(away), home=abbr(home), kickoff=_fmt_kickoff_local(a['start']),
+            edge_pct=a['edge']*100, pick=a['pick'], odds=a['odds'], stake=a['stake'],
+        ))
 
     if not lines:
         logger.info("All candidate alerts already notified; skipping Discord push")
@@ -513,22 +510,22 @@ def run_once():
     push(TITLE + (" - Test" if forced else ""), lines)
 
 def _alloc_times(start: str, end: str, count: int) -> list[str]:
-    from datetime import datetime as _dt
-    fmt = "%H:%M"
-    s = _dt.strptime(start, fmt)
-    e = _dt.strptime(end, fmt)
-    total = int((e - s).total_seconds() // 60)
+    """Spread ``count`` HH:MM poll times evenly from ``start`` towards ``end``."""
+    s = int(start[:2]) * 60 + int(start[3:5])
+    total = int(end[:2]) * 60 + int(end[3:5]) - s
     if total <= 0 or count <= 0:
         return []
     if count == 1:
         return [start]
     step = max(1, round(total / (count - 1)))
+    # Offsets are non-decreasing, so duplicates (clamped at ``total``) are adjacent
     times = []
     for i in range(count):
-        m = min(total, i * step)
-        t = (s.replace()) + timedelta(minutes=int(m))
-        times.append(t.strftime(fmt))
-    return sorted(list(dict.fromkeys(times)))
+        m = s + min(total, i * step)
+        t = f"{m // 60:02d}:{m % 60:02d}"
+        if not times or t != times[-1]:
+            times.append(t)
+    return times
 
 def _schedule_at(day: str, times: list[str], tag: str):
     for t in times:
@@ -596,6 +593,12 @@ if __name__=="__main__":
         run_once()
     else:
         schedule_jobs()
+        # Sleep until the next job is due instead of polling every second;
+        # cap each nap so wall-clock jumps (suspend, NTP) are noticed promptly
         while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break  # no jobs scheduled
+            if idle > 0:
+                time.sleep(min(idle, 60))
             schedule.run_pending()
-            time.sleep(1)
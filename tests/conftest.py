@@ -0,0 +1,55 @@
+import sqlite3
+
+import pytest
+import responses
+
+from app.core import http_cache, store
+
+SHARED_DB_URI = "file:nflbot_test?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="session")
+def _shared_db_keeper():
+    # A shared-cache in-memory database lives only while a connection to it
+    # is open, so hold one for the whole session.
+    conn = sqlite3.connect(SHARED_DB_URI, uri=True)
+    conn.executescript(store.DDL)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def shared_db(_shared_db_keeper, monkeypatch):
+    """Point the ledger at the session's in-memory database, emptied after each test."""
+    monkeypatch.setattr(store, "DB_PATH", SHARED_DB_URI)
+    yield SHARED_DB_URI
+    with _shared_db_keeper:
+        _shared_db_keeper.execute("DELETE FROM signals")
+
+
+@pytest.fixture
+def store_conn(shared_db, _shared_db_keeper):
+    """The session's open connection to the ledger, for reading back rows."""
+    return _shared_db_keeper
+
+
+@pytest.fixture
+def odds_cache(monkeypatch):
+    """Enable the Odds API body cache on a fake clock; call the result to age entries."""
+    now = [0.0]
+
+    def advance(seconds):
+        now[0] += seconds
+
+    monkeypatch.setenv("ODDS_CACHE_TTL", "60")
+    monkeypatch.setattr(http_cache, "monotonic", lambda: now[0])
+    http_cache.clear()
+    yield advance
+    http_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def mocked_responses():
+    """Intercept every ``requests`` call; unregistered URLs raise instead of hitting the network."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rm:
+        yield rm
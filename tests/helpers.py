@@ -0,0 +1,51 @@
+"""Shared HTTP test doubles and assertions for the adapter tests."""
+
+import json
+import math
+from dataclasses import dataclass, field
+
+import requests
+
+
+@dataclass
+class FakeResponse:
+    data: object = None
+    status_code: int = 200
+    headers: dict = field(default_factory=dict)
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self.data).encode()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(response=self)
+
+
+class FakeSession:
+    """Return a canned response and record each ``get`` call."""
+
+    def __init__(self, response):
+        self._response = response
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        self.calls.append({"url": url, "params": params, "timeout": timeout, "headers": headers})
+        return self._response
+
+
+def assert_probs_close(got, expected, rel=1e-4):
+    """Compare every key of ``expected`` and report all mismatches in one failure."""
+    bad = {
+        k: (got.get(k), v)
+        for k, v in expected.items()
+        if got.get(k) is None or not math.isclose(got[k], v, rel_tol=rel)
+    }
+    assert not bad, f"(got, expected) mismatches: {bad}"
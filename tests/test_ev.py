@@ -1,11 +1,5 @@
-import sys
-from pathlib import Path
-
 import pytest
 
-# Ensure the application package is importable when tests are run directly.
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from app.core import ev
 
 
@@ -35,3 +29,10 @@ def test_push_probability_adjusts_break_even_and_ev():
     assert pytest.approx(ev_with_push, 1e-6) == 0.00454545
     be_with_push = ev.break_even_prob(-110, 0.05)
     assert pytest.approx(be_with_push, 1e-6) == 0.497619
+
+
+@pytest.mark.parametrize("p_win,odds,p_push", [(0.5, 200, 0.0), (0.55, -110, 0.0), (0.5, -110, 0.05)])
+def test_ev_and_kelly_matches_separate_helpers(p_win, odds, p_push):
+    ev_val, k = ev.ev_and_kelly(p_win, odds, p_push)
+    assert pytest.approx(ev_val, 1e-12) == ev.expected_value_per_dollar(p_win, odds, p_push)
+    assert pytest.approx(k, 1e-12) == ev.kelly_fraction(p_win, odds, p_push)
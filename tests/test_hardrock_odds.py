@@ -1,41 +1,14 @@
 """Tests for :mod:`app.adapters.hardrock_odds`."""
 
-from pathlib import Path
+import os
 from unittest.mock import Mock, patch
 
-import os
 import pytest
 import requests
 
-# Ensure the application package is importable when tests are run directly.
-import sys
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from app.adapters.hardrock_odds import fetch_hr_nfl_moneylines
-
-
-class DummySession:
-    def __init__(self, response):
-        self._response = response
-        self.calls = []
-
-    def get(self, url, params=None, timeout=None):
-        self.calls.append({"url": url, "params": params, "timeout": timeout})
-        return self._response
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
-
-def _mock_response(json_data, status_code=200):
-    response = Mock()
-    response.json.return_value = json_data
-    response.status_code = status_code
-    response.raise_for_status.return_value = None
-    return response
+from app.core import http_cache
+from helpers import FakeResponse, FakeSession
 
 
 def test_fetch_hr_nfl_moneylines_parses_response_and_skips_past_games():
@@ -78,8 +51,8 @@ def test_fetch_hr_nfl_moneylines_parses_response_and_skips_past_games():
     ]
 
     with patch(
-        "app.adapters.hardrock_odds._build_retry_session",
-        return_value=DummySession(_mock_response(sample)),
+        "app.adapters.hardrock_odds.build_retry_session",
+        return_value=FakeSession(FakeResponse(sample)),
     ):
         games = fetch_hr_nfl_moneylines(days_from=36500)
 
@@ -102,33 +75,92 @@ def test_fetch_hr_nfl_moneylines_parses_response_and_skips_past_games():
 
 def test_fetch_hr_nfl_moneylines_uses_api_key_and_days_from():
     sample = []
-    session = DummySession(_mock_response(sample))
+    session = FakeSession(FakeResponse(sample))
 
     with patch.dict(os.environ, {"THEODDSAPI": "testkey"}):
-        with patch("app.adapters.hardrock_odds._build_retry_session", return_value=session):
+        with patch("app.adapters.hardrock_odds.build_retry_session", return_value=session):
             fetch_hr_nfl_moneylines(days_from=2)
 
     assert session.calls
     params = session.calls[0]["params"]
     assert params["apiKey"] == "testkey"
     assert params["daysFrom"] == "2"
+    assert params["commenceTimeFrom"] < params["commenceTimeTo"]
 
 
 def test_fetch_hr_nfl_moneylines_http_error():
-    response = _mock_response({}, status_code=500)
-    response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    response = FakeResponse({}, status_code=500)
 
     with patch(
-        "app.adapters.hardrock_odds._build_retry_session",
-        return_value=DummySession(response),
+        "app.adapters.hardrock_odds.build_retry_session",
+        return_value=FakeSession(response),
     ):
         with pytest.raises(RuntimeError):
             fetch_hr_nfl_moneylines()
 
 
 def test_fetch_hr_nfl_moneylines_timeout():
-    session = DummySession(_mock_response({}))
+    session = FakeSession(FakeResponse({}))
     session.get = Mock(side_effect=requests.Timeout)
-    with patch("app.adapters.hardrock_odds._build_retry_session", return_value=session):
+    with patch("app.adapters.hardrock_odds.build_retry_session", return_value=session):
         with pytest.raises(RuntimeError):
             fetch_hr_nfl_moneylines()
+
+
+def test_fetch_hr_nfl_moneylines_reuses_cached_body_within_ttl(monkeypatch, odds_cache):
+    # The kickoff window moves every poll; the cache key must not
+    hours = iter(range(10, 20))
+    monkeypatch.setattr(
+        "app.adapters.hardrock_odds.commence_window",
+        lambda days_from: {"commenceTimeFrom": f"2099-09-07T{next(hours)}:00:00Z"},
+    )
+    response = FakeResponse([])
+    response.headers = {"ETag": '"v1"'}
+    session = FakeSession(response)
+
+    with patch("app.adapters.hardrock_odds.build_retry_session", return_value=session):
+        fetch_hr_nfl_moneylines(days_from=3)
+        fetch_hr_nfl_moneylines(days_from=3)
+    assert len(session.calls) == 1
+
+    # Once stale, the next request revalidates with the stored ETag
+    odds_cache(61)
+    response.status_code = 304
+    with patch("app.adapters.hardrock_odds.build_retry_session", return_value=session):
+        assert fetch_hr_nfl_moneylines(days_from=3) == []
+    assert session.calls[-1]["headers"] == {"If-None-Match": '"v1"'}
+    assert len(http_cache._ENTRIES) == 1
+
+
+def test_fetch_hr_nfl_moneylines_skips_malformed_events():
+    def event(game_id, price):
+        return {
+            "id": game_id,
+            "commence_time": "2099-09-07T17:00:00Z",
+            "home_team": "JAX",
+            "away_team": "MIA",
+            "bookmakers": [
+                {
+                    "key": "hardrock",
+                    "markets": [
+                        {
+                            "key": "h2h",
+                            "outcomes": [
+                                {"name": "JAX", "price": price},
+                                {"name": "MIA", "price": 120},
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+
+    sample = [event("bad", "n/a"), event("good", -130)]
+    with patch(
+        "app.adapters.hardrock_odds.build_retry_session",
+        return_value=FakeSession(FakeResponse(sample)),
+    ):
+        games = fetch_hr_nfl_moneylines(days_from=36500)
+
+    assert [g["game_id"] for g in games] == ["good"]
+    assert games[0]["ml_home"] == -130
@@ -1,21 +1,14 @@
-from pathlib import Path
-import sqlite3
-
-import sys
+from concurrent.futures import Future
 
 import pytest
 
-# Ensure repo root on path for package imports
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from app.core import store
 from app import main as app_main
 
+# Keep SQLite-backed modules on one worker under ``pytest -n auto --dist loadgroup``
+pytestmark = pytest.mark.xdist_group("sqlite")
 
-def test_integration_run_once_pushes_and_persists(monkeypatch, tmp_path):
-    # Point ledger at a temp DB
-    store.DB_PATH = str(tmp_path / "signals.sqlite")
 
+def test_integration_run_once_pushes_and_persists(monkeypatch, store_conn):
     # Mock Hard Rock odds: one future game
     games = [
         {
@@ -41,7 +34,8 @@ def test_integration_run_once_pushes_and_persists(monkeypatch, tmp_path):
             "prices": {"home": {-2.5: -110}, "away": {2.5: -110}},
         }
     }
-    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs: ref)
+    monkeypatch.setattr(app_main, "fetch_pinnacle_board", lambda days_from=None: [])
+    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs, events: ref)
 
     pushed = {}
 
@@ -70,13 +64,11 @@ def test_integration_run_once_pushes_and_persists(monkeypatch, tmp_path):
     assert "* Stake:" in block
 
     # Assert row persisted once
-    with sqlite3.connect(store.DB_PATH) as conn:
-        rows = conn.execute("SELECT game_id, pick, odds, stake FROM signals").fetchall()
+    rows = store_conn.execute("SELECT game_id, pick, odds, stake FROM signals").fetchall()
     assert rows and rows[0][0] == "G1" and "HOM -2.5" in rows[0][1]
 
 
-def test_integration_run_once_moneyline(monkeypatch, tmp_path):
-    store.DB_PATH = str(tmp_path / "signals_ml.sqlite")
+def test_integration_run_once_moneyline(monkeypatch, store_conn):
     games = [
         {
             "game_id": "G2",
@@ -101,7 +93,8 @@ def test_integration_run_once_moneyline(monkeypatch, tmp_path):
             "ml": {"home": 0.55, "away": 0.45},
         }
     }
-    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs: ref)
+    monkeypatch.setattr(app_main, "fetch_pinnacle_board", lambda days_from=None: [])
+    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs, events: ref)
     pushed = {}
     monkeypatch.setattr(app_main, "push", lambda title, lines: pushed.update(title=title, lines=lines))
     monkeypatch.setattr(app_main, "BANKROLL", 100.0)
@@ -112,14 +105,12 @@ def test_integration_run_once_moneyline(monkeypatch, tmp_path):
     monkeypatch.setattr(app_main, "MAX_INTERP_GAP", 2.0)
     app_main.run_once()
     assert pushed.get("lines") and "ML" in pushed["lines"][0]
-    with sqlite3.connect(store.DB_PATH) as conn:
-        rows = conn.execute("SELECT market, pick FROM signals").fetchall()
+    rows = store_conn.execute("SELECT market, pick FROM signals").fetchall()
     assert rows and rows[0][0] == "ML" and "HOM ML" in rows[0][1]
 
 
-def test_integration_positive_odds_format(monkeypatch, tmp_path):
+def test_integration_positive_odds_format(monkeypatch, shared_db):
     """Discord notification should include '+' for positive American odds."""
-    store.DB_PATH = str(tmp_path / "signals_pos.sqlite")
     games = [
         {
             "game_id": "G3",
@@ -137,7 +128,8 @@ def test_integration_positive_odds_format(monkeypatch, tmp_path):
     ]
     monkeypatch.setattr(app_main, "fetch_hr_nfl_moneylines", lambda days_from=7: games)
     ref = {"G3": {"fav_ladder": {}, "ml": {"home": 0.45, "away": 0.55}}}
-    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs: ref)
+    monkeypatch.setattr(app_main, "fetch_pinnacle_board", lambda days_from=None: [])
+    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs, events: ref)
     pushed = {}
     monkeypatch.setattr(app_main, "push", lambda title, lines: pushed.update(title=title, lines=lines))
     monkeypatch.setattr(app_main, "BANKROLL", 100.0)
@@ -148,3 +140,105 @@ def test_integration_positive_odds_format(monkeypatch, tmp_path):
     monkeypatch.setattr(app_main, "MAX_INTERP_GAP", 2.0)
     app_main.run_once()
     assert pushed.get("lines") and "+120" in pushed["lines"][0]
+
+
+def test_integration_run_once_test_force_uses_first_pass_evals(monkeypatch, store_conn):
+    # Fair prices on both sides: nothing clears the EV threshold
+    games = [
+        {
+            "game_id": "G1",
+            "home": "HOM",
+            "away": "AWY",
+            "start_utc": "2099-09-07T17:00:00Z",
+            "market": "BOTH",
+            "odds_home": -110,
+            "odds_away": -110,
+            "line_home": -2.5,
+            "line_away": 2.5,
+            "ml_home": -130,
+            "ml_away": 110,
+        }
+    ]
+    ref = {
+        "G1": {
+            "fav_ladder": {-2.5: 0.5},
+            "ladder": {"home": {-2.5: 0.5}, "away": {2.5: 0.5}},
+            "prices": {"home": {-2.5: -110}, "away": {2.5: -110}},
+            "ml": {"home": 0.55, "away": 0.45, "prices": {"home": -125, "away": 115}},
+        }
+    }
+    monkeypatch.setattr(app_main, "fetch_hr_nfl_moneylines", lambda days_from=7: games)
+    monkeypatch.setattr(app_main, "fetch_pinnacle_board", lambda days_from=None: [])
+    monkeypatch.setattr(app_main, "reference_probs_for", lambda gs, events: ref)
+    monkeypatch.setattr(app_main, "TEST_FORCE_OPPS", True)
+    monkeypatch.setattr(app_main, "TEST_FORCE_COUNT", 3)
+
+    pushed = {}
+
+    def fake_push(title, lines):
+        pushed["title"] = title
+        pushed["lines"] = lines
+
+    monkeypatch.setattr(app_main, "push", fake_push)
+
+    app_main.run_once()
+
+    assert pushed["title"].endswith(" - Test")
+    assert len(pushed["lines"]) == 3
+    assert all("* Stake: $" in block for block in pushed["lines"])
+    # Forced alerts are never written to the ledger
+    assert store_conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0] == 0
+
+
+class _InlineExecutor:
+    """Run submitted calls immediately so board fetches are counted exactly."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _stub_fetches(monkeypatch, hard_rock):
+    """Stub both Odds API fetches and return the recorded board calls."""
+    board_calls = []
+
+    def fake_board(days_from=None):
+        board_calls.append(days_from)
+        return []
+
+    monkeypatch.setattr(app_main, "_LAST_HR_EMPTY", False)
+    monkeypatch.setattr(app_main, "_LAST_QUOTA_HIT", False)
+    monkeypatch.setattr(app_main, "_board_pool", _InlineExecutor)
+    monkeypatch.setattr(app_main, "fetch_hr_nfl_moneylines", lambda days_from=7: hard_rock())
+    monkeypatch.setattr(app_main, "fetch_pinnacle_board", fake_board)
+    monkeypatch.setattr(app_main, "push", lambda title, lines: None)
+    return board_calls
+
+
+def test_run_once_skips_pinnacle_after_empty_hard_rock_poll(monkeypatch):
+    board_calls = _stub_fetches(monkeypatch, lambda: [])
+
+    # First empty poll still overlaps both fetches; the next one skips Pinnacle
+    app_main.run_once()
+    assert len(board_calls) == 1
+    app_main.run_once()
+    assert len(board_calls) == 1
+    assert app_main._LAST_HR_EMPTY is True
+
+
+def test_run_once_skips_pinnacle_after_hard_rock_quota_error(monkeypatch):
+    def quota_hit():
+        raise app_main.OddsApiQuotaError("quota")
+
+    board_calls = _stub_fetches(monkeypatch, quota_hit)
+
+    app_main.run_once()
+    assert len(board_calls) == 1
+    # No Pinnacle request is spent while Hard Rock is still over quota
+    app_main.run_once()
+    assert len(board_calls) == 1
+    assert app_main._LAST_QUOTA_HIT is True
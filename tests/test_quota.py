@@ -1,16 +1,12 @@
 import importlib
-import sys
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import requests
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import responses
 
 from app.core.errors import OddsApiQuotaError
-from app.adapters.hardrock_odds import fetch_hr_nfl_moneylines
-from app.adapters.reference_probs import reference_probs_for
+from app.adapters.hardrock_odds import API_URL as HR_API_URL, fetch_hr_nfl_moneylines
+from app.adapters.reference_probs import ODDS_API_URL as PINNACLE_API_URL, reference_probs_for
 
 
 class FixedDatetimeFactory:
@@ -35,61 +31,23 @@ def _reload_main():
     return importlib.reload(main)
 
 
-class Resp:
-    def __init__(self, status=402, data=None, text=""):
-        self.status_code = status
-        self._data = data or []
-        self.headers = {"X-Requests-Remaining": "0"}
-        self.text = text
-
-    def raise_for_status(self):
-        if self.status_code != 200:
-            raise requests.HTTPError(response=self)
-
-    def json(self):
-        return self._data
-
-
-class DummySession:
-    def __init__(self, response):
-        self._response = response
-
-    def get(self, url, params=None, timeout=None):
-        return self._response
-
-    def __enter__(self):
-        return self
+def test_hardrock_quota_raises(mocked_responses):
+    mocked_responses.add(responses.GET, HR_API_URL, status=402)
+    with pytest.raises(OddsApiQuotaError):
+        fetch_hr_nfl_moneylines(days_from=1)
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
 
-
-def test_hardrock_quota_raises():
-    with patch(
-        "app.adapters.hardrock_odds._build_retry_session",
-        return_value=DummySession(Resp(402)),
-    ):
-        with pytest.raises(OddsApiQuotaError):
-            fetch_hr_nfl_moneylines(days_from=1)
-
-
-def test_hardrock_unauthorized_quota_raises():
+def test_hardrock_unauthorized_quota_raises(mocked_responses):
     payload = {"success": False, "message": "Monthly plan quota reached"}
-    with patch(
-        "app.adapters.hardrock_odds._build_retry_session",
-        return_value=DummySession(Resp(401, data=payload)),
-    ):
-        with pytest.raises(OddsApiQuotaError):
-            fetch_hr_nfl_moneylines(days_from=1)
+    mocked_responses.add(responses.GET, HR_API_URL, json=payload, status=401)
+    with pytest.raises(OddsApiQuotaError):
+        fetch_hr_nfl_moneylines(days_from=1)
 
 
-def test_reference_quota_raises():
-    with patch(
-        "app.adapters.reference_probs._build_retry_session",
-        return_value=DummySession(Resp(429)),
-    ):
-        with pytest.raises(OddsApiQuotaError):
-            reference_probs_for([{"game_id": "G1"}])
+def test_reference_quota_raises(mocked_responses):
+    mocked_responses.add(responses.GET, PINNACLE_API_URL, status=429)
+    with pytest.raises(OddsApiQuotaError):
+        reference_probs_for([{"game_id": "G1"}])
 
 
 def test_run_once_quota_notified_once_per_month(monkeypatch):
@@ -99,6 +57,7 @@ def test_run_once_quota_notified_once_per_month(monkeypatch):
 
     with (
         patch.object(main, "fetch_hr_nfl_moneylines", side_effect=main.OddsApiQuotaError("quota")) as fetch_mock,
+        patch.object(main, "fetch_pinnacle_board", return_value=[]),
         patch.object(main, "push") as push_mock,
     ):
         main.run_once()
@@ -117,6 +76,7 @@ def test_run_once_quota_resets_on_new_month(monkeypatch):
 
     with (
         patch.object(main, "fetch_hr_nfl_moneylines", side_effect=main.OddsApiQuotaError("quota")) as fetch_mock,
+        patch.object(main, "fetch_pinnacle_board", return_value=[]),
         patch.object(main, "push") as push_mock,
     ):
         monkeypatch.setattr(main, "datetime", jan_dt)
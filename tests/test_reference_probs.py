@@ -1,49 +1,85 @@
-import sys
-from pathlib import Path
-
 import pytest
 import requests
+import responses
+
+from app.adapters.reference_probs import (
+    ODDS_API_URL,
+    build_pinnacle_fair_ladder,
+    fetch_pinnacle_board,
+    reference_probs_for,
+)
+from app.core import http_cache
+from helpers import assert_probs_close
+
+
+SPREADS_MARKET = {
+    "key": "spreads",
+    "outcomes": [
+        {"name": "H", "price": -120, "point": -2.5},
+        {"name": "A", "price": 110, "point": 2.5},
+    ],
+}
+H2H_MARKET = {
+    "key": "h2h",
+    "outcomes": [
+        {"name": "H", "price": -150},
+        {"name": "A", "price": 130},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "markets,expected_p_home,expected_p_away",
+    [
+        # At -2.5 the de-vig fair probs should match the ratio of quoted probs
+        pytest.param([SPREADS_MARKET, H2H_MARKET], 0.5338983050847457, 0.4661016949152542, id="spreads+h2h"),
+        pytest.param([H2H_MARKET], None, None, id="h2h_only"),
+    ],
+)
+def test_reference_probs_from_external(mocked_responses, markets, expected_p_home, expected_p_away):
+    games = [
+        {"game_id": "G1", "home": "H", "away": "A"},
+        {"game_id": "G2", "home": "H2", "away": "A2"},
+    ]
 
-# Ensure repo root on path for package imports
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from app.adapters.reference_probs import reference_probs_for
-
-
-class DummyResponse:
-    def __init__(self, data, status_code: int = 200):
-        self._data = data
-        self.status_code = status_code
-        self.headers = {}
-
-    def raise_for_status(self):
-        if self.status_code != 200:
-            raise requests.HTTPError(self.status_code)
-
-    def json(self):
-        return self._data
-
-
-class DummySession:
-    def __init__(self, response):
-        self._response = response
+    external = [
+        {
+            "id": game_id,
+            "home_team": "H",
+            "away_team": "A",
+            "bookmakers": [{"key": "pinnacle", "markets": markets}],
+        }
+        for game_id in ("G1", "G2")
+    ]
 
-    def get(self, url, params=None, timeout=None):
-        return self._response
+    mocked_responses.add(responses.GET, ODDS_API_URL, json=external)
 
-    def __enter__(self):
-        return self
+    probs = reference_probs_for(games)
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    # One board request covers every game
+    assert len(mocked_responses.calls) == 1
+    assert sorted(probs) == ["G1", "G2"]
+    if expected_p_home is None:
+        assert "p_home" not in probs["G1"] and "p_away" not in probs["G1"]
+    else:
+        assert_probs_close(probs["G1"], {"p_home": expected_p_home, "p_away": expected_p_away})
+    # Moneyline probabilities
+    assert_probs_close(probs["G1"]["ml"], {"home": 0.5798319327731092, "away": 0.42016806722689076})
 
 
-def test_reference_probs_from_external(monkeypatch):
+def test_reference_probs_raises_on_external_failure(mocked_responses):
     games = [
         {"game_id": "G1", "home": "H", "away": "A"}
     ]
 
-    external = [
+    mocked_responses.add(responses.GET, ODDS_API_URL, body=requests.RequestException())
+
+    with pytest.raises(RuntimeError):
+        reference_probs_for(games)
+
+
+def test_reference_probs_uses_prefetched_board_without_http(mocked_responses):
+    events = [
         {
             "id": "G1",
             "home_team": "H",
@@ -52,13 +88,6 @@ def test_reference_probs_from_external(monkeypatch):
                 {
                     "key": "pinnacle",
                     "markets": [
-                        {
-                            "key": "spreads",
-                            "outcomes": [
-                                {"name": "H", "price": -120, "point": -2.5},
-                                {"name": "A", "price": 110, "point": 2.5},
-                            ],
-                        },
                         {
                             "key": "h2h",
                             "outcomes": [
@@ -72,36 +101,118 @@ def test_reference_probs_from_external(monkeypatch):
         }
     ]
 
-    session = DummySession(DummyResponse(external))
-    monkeypatch.setattr(
-        "app.adapters.reference_probs._build_retry_session",
-        lambda: session,
-    )
-
-    probs = reference_probs_for(games)
-
-    assert "G1" in probs
-    # At -2.5 the de-vig fair probs should match the ratio of quoted probs
-    assert pytest.approx(probs["G1"]["p_home"], 0.0001) == 0.5338983050847457
-    assert pytest.approx(probs["G1"]["p_away"], 0.0001) == 0.4661016949152542
-    # Moneyline probabilities
-    assert pytest.approx(probs["G1"]["ml"]["home"], 0.0001) == 0.5798319327731092
-    assert pytest.approx(probs["G1"]["ml"]["away"], 0.0001) == 0.42016806722689076
-
-
-def test_reference_probs_raises_on_external_failure(monkeypatch):
-    games = [
-        {"game_id": "G1", "home": "H", "away": "A"}
-    ]
-
-    session = DummySession(DummyResponse([]))
-    def failing_get(url, params=None, timeout=None):
-        raise requests.RequestException
-    session.get = failing_get
-    monkeypatch.setattr(
-        "app.adapters.reference_probs._build_retry_session",
-        lambda: session,
-    )
+    probs = reference_probs_for([{"game_id": "G1"}, {"game_id": "G2"}], events)
+
+    assert list(probs) == ["G1"]
+    assert len(mocked_responses.calls) == 0
+    assert_probs_close(probs["G1"]["ml"], {"home": 0.5798319327731092})
+
+
+def test_reference_probs_fav_ladder_matches_standalone_builder():
+    event = {
+        "id": "G1",
+        "home_team": "H",
+        "away_team": "A",
+        "bookmakers": [
+            {
+                "key": "pinnacle",
+                "markets": [
+                    {
+                        "key": "spreads",
+                        "outcomes": [
+                            {"name": "H", "price": -110, "point": -3.5},
+                            {"name": "A", "price": -105, "point": 3.5},
+                        ],
+                    },
+                    {
+                        "key": "spreads",
+                        "outcomes": [
+                            {"name": "H", "price": 120, "point": 2.5},
+                            {"name": "A", "price": -140, "point": -2.5},
+                        ],
+                    },
+                    # Outcome names need not match the event's teams
+                    {
+                        "key": "spreads",
+                        "outcomes": [
+                            {"name": "Home", "price": 150, "point": -6.5},
+                            {"name": "Away", "price": -170, "point": 6.5},
+                        ],
+                    },
+                ],
+            }
+        ],
+    }
+
+    probs = reference_probs_for([{"game_id": "G1"}], [event])
+
+    assert probs["G1"]["fav_ladder"] == build_pinnacle_fair_ladder(event)
+    assert sorted(probs["G1"]["fav_ladder"]) == [-6.5, -3.5, -2.5]
+
+
+BOARD = [{"id": "G1", "home_team": "H", "away_team": "A", "bookmakers": []}]
+
+
+def test_fetch_pinnacle_board_serves_fresh_body_then_revalidates(mocked_responses, odds_cache):
+    mocked_responses.add(responses.GET, ODDS_API_URL, json=BOARD, headers={"ETag": '"v1"'})
+    mocked_responses.add(responses.GET, ODDS_API_URL, status=304)
+
+    assert fetch_pinnacle_board() == BOARD
+    assert fetch_pinnacle_board() == BOARD
+    assert len(mocked_responses.calls) == 1
+
+    # Once stale, a 304 refreshes the stored body without a new download
+    odds_cache(61)
+    assert fetch_pinnacle_board() == BOARD
+    assert len(mocked_responses.calls) == 2
+    assert mocked_responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+def test_fetch_pinnacle_board_does_not_cache_malformed_body(mocked_responses, odds_cache):
+    mocked_responses.add(responses.GET, ODDS_API_URL, body="not json", headers={"ETag": '"bad"'})
+    mocked_responses.add(responses.GET, ODDS_API_URL, json=BOARD)
 
     with pytest.raises(RuntimeError):
-        reference_probs_for(games)
+        fetch_pinnacle_board()
+    assert fetch_pinnacle_board() == BOARD
+    assert len(mocked_responses.calls) == 2
+    assert "If-None-Match" not in mocked_responses.calls[1].request.headers
+
+
+def test_fetch_pinnacle_board_refetches_when_304_finds_no_entry(mocked_responses, odds_cache):
+    mocked_responses.add(responses.GET, ODDS_API_URL, json=[], headers={"ETag": '"v1"'})
+    fetch_pinnacle_board()
+
+    def not_modified_after_clear(request):
+        http_cache.clear()
+        return 304, {}, ""
+
+    odds_cache(61)
+    mocked_responses.reset()
+    mocked_responses.add_callback(responses.GET, ODDS_API_URL, callback=not_modified_after_clear)
+    mocked_responses.add(responses.GET, ODDS_API_URL, json=BOARD)
+
+    assert fetch_pinnacle_board() == BOARD
+    assert len(mocked_responses.calls) == 2
+    assert "If-None-Match" not in mocked_responses.calls[1].request.headers
+
+
+def test_build_pinnacle_fair_ladder_rejects_malformed_point():
+    event = {
+        "bookmakers": [
+            {
+                "key": "pinnacle",
+                "markets": [
+                    {
+                        "key": "spreads",
+                        "outcomes": [
+                            {"name": "H", "price": -110, "point": "n/a"},
+                            {"name": "A", "price": -110, "point": 3.5},
+                        ],
+                    },
+                ],
+            }
+        ],
+    }
+
+    assert build_pinnacle_fair_ladder(event) is None
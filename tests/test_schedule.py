@@ -0,0 +1,14 @@
+from app import main
+
+
+def test_alloc_times_spreads_polls_across_window():
+    assert main._alloc_times("12:30", "12:59", 6) == ["12:30", "12:36", "12:42", "12:48", "12:54", "12:59"]
+    assert main._alloc_times("19:05", "20:10", 3) == ["19:05", "19:37", "20:09"]
+
+
+def test_alloc_times_collapses_duplicates_and_handles_edges():
+    # More polls than minutes: offsets clamp to the end and are deduped
+    assert main._alloc_times("11:30", "11:32", 5) == ["11:30", "11:31", "11:32"]
+    assert main._alloc_times("11:30", "11:45", 1) == ["11:30"]
+    assert main._alloc_times("11:45", "11:30", 3) == []
+    assert main._alloc_times("11:30", "11:45", 0) == []
@@ -1,18 +1,12 @@
-import sqlite3
-import sys
-from pathlib import Path
-
 import pytest
 
-# Ensure the application package is importable when tests are run directly.
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from app.core import store
 
+# Keep SQLite-backed modules on one worker under ``pytest -n auto --dist loadgroup``
+pytestmark = pytest.mark.xdist_group("sqlite")
+
 
-def test_save_signal_persists_data_with_negative_odds_and_zero_kelly(tmp_path):
-    db_file = tmp_path / "signals.sqlite"
-    store.DB_PATH = str(db_file)
+def test_save_signal_persists_data_with_negative_odds_and_zero_kelly(store_conn):
     sig = {
         "game_id": "G1",
         "market": "ML",
@@ -27,22 +21,19 @@ def test_save_signal_persists_data_with_negative_odds_and_zero_kelly(tmp_path):
     inserted = store.save_signal(sig)
     assert inserted is True
 
-    with sqlite3.connect(store.DB_PATH) as conn:
-        row = conn.execute(
-            "SELECT game_id, market, pick, odds, kelly FROM signals"
-        ).fetchone()
+    row = store_conn.execute(
+        "SELECT game_id, market, pick, odds, kelly FROM signals"
+    ).fetchone()
     assert row == ("G1", "ML", "HOME", -120, 0.0)
 
 
-def test_save_signal_requires_all_fields(tmp_path):
-    store.DB_PATH = str(tmp_path / "signals.sqlite")
+def test_save_signal_requires_all_fields(shared_db):
     bad_sig = {"game_id": "G1"}  # Missing required fields
     with pytest.raises(KeyError):
         store.save_signal(bad_sig)
 
 
-def test_save_signal_deduplicates_on_unique_key(tmp_path):
-    store.DB_PATH = str(tmp_path / "signals.sqlite")
+def test_save_signal_deduplicates_on_unique_key(store_conn):
     sig = {
         "game_id": "G1",
         "market": "ML",
@@ -58,13 +49,62 @@ def test_save_signal_deduplicates_on_unique_key(tmp_path):
     assert store.save_signal(sig) is True
     assert store.save_signal(sig) is False
 
-    with sqlite3.connect(store.DB_PATH) as conn:
-        cnt = conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+    cnt = store_conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
     assert cnt == 1
 
     # Changing odds should allow a new row (unique key includes odds)
     sig2 = dict(sig, odds=-115)
     assert store.save_signal(sig2) is True
-    with sqlite3.connect(store.DB_PATH) as conn:
-        cnt = conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+    cnt = store_conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
+    assert cnt == 2
+
+
+def test_save_signals_batches_and_stops_at_limit(store_conn):
+    base = {
+        "game_id": "G1",
+        "market": "ML",
+        "pick": "HOME",
+        "odds": -120,
+        "p_true": 0.55,
+        "edge": 0.05,
+        "kelly": 0.02,
+        "stake": 10.0,
+    }
+    assert store.save_signal(base) is True
+
+    sigs = [base, dict(base, odds=-115), dict(base, odds=-110), dict(base, odds=-105)]
+    # The duplicate does not count towards the limit; the last signal is untouched
+    assert store.save_signals(sigs, limit=2) == [False, True, True]
+
+    odds = [r[0] for r in store_conn.execute("SELECT odds FROM signals ORDER BY id")]
+    assert odds == [-120, -115, -110]
+
+
+def test_db_reuses_connection_per_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "DB_PATH", str(tmp_path / "a.sqlite"))
+    try:
+        first = store.db()
+        assert store.db() is first
+        monkeypatch.setattr(store, "DB_PATH", str(tmp_path / "b.sqlite"))
+        assert store.db() is not first
+    finally:
+        store.close()
+
+
+def test_save_signals_skips_duplicates_within_batch(store_conn):
+    sig = {
+        "game_id": "G1",
+        "market": "ML",
+        "pick": "HOME",
+        "odds": -120,
+        "p_true": 0.55,
+        "edge": 0.05,
+        "kelly": 0.02,
+        "stake": 10.0,
+    }
+    sig2 = dict(sig, pick="AWAY", odds=110)
+
+    assert store.save_signals([sig, sig, sig2]) == [True, False, True]
+
+    cnt = store_conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0]
     assert cnt == 2
@@ -1,26 +1,18 @@
-import sys
-from pathlib import Path
-
-import pytest
-
-# Ensure the application package is importable when tests are run directly.
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from app import main
 
 
 def test_spread_threshold_defaults_to_three_percent_floor():
-    assert main._spread_edge_threshold({}, 2.5) == pytest.approx(0.03, abs=1e-9)
+    assert main._spread_edge_threshold({}, 2.5) == main.BASE_SPREAD_EDGE == 0.03
 
 
 def test_spread_threshold_increases_near_key_numbers_when_interpolated():
     meta = {"interpolated": True}
-    assert main._spread_edge_threshold(meta, 3.0) == pytest.approx(0.04, abs=1e-9)
+    assert main._spread_edge_threshold(meta, 3.0) == main.NEAR_KEY_SPREAD_EDGE == 0.04
 
 
 def test_spread_threshold_increases_for_whole_number_lines():
     meta = {"whole": True}
-    assert main._spread_edge_threshold(meta, -6.0) == pytest.approx(0.035, abs=1e-9)
+    assert main._spread_edge_threshold(meta, -6.0) == main.WHOLE_SPREAD_EDGE == 0.035
 
 
 def test_alert_must_clear_threshold():